@@ -0,0 +1,199 @@
+"""
+Benchmark harness for the Quantum-Sandbox hot paths.
+
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --baseline bench.json   # flag regressions
+
+Every benchmark is parameterized by a size; each (benchmark, size) pair is
+timed as the best and median per-call time over several repeats.
+"""
+import os
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import statistics
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))) # Root anchor
+
+import numpy as np
+
+# BENCHMARK REGISTRY
+# name -> (sizes, setup). setup(size) returns the zero-argument callable to time.
+BENCHMARKS = {}
+
+def benchmark(name, sizes):
+    def register(setup):
+        BENCHMARKS[name] = (sizes, setup)
+        return setup
+    return register
+
+@benchmark("auditor.process_intent_state", sizes=[16, 256, 4096])
+def _auditor_intent(size):
+    """One pulse for an intent string of `size` characters."""
+    from core_physics.auditor_logic import AuditorLogic
+    auditor = AuditorLogic(observer_mass=80, vacuum_index=-1)
+    intent = ''.join(random.Random(size).choice('abcdefghijklmnopqrstuvwxyz ') for _ in range(size))
+    return lambda: auditor.process_intent_state(intent)
+
+@benchmark("auditor.intent_purities", sizes=[32, 10000])
+def _auditor_batch(size):
+    """A batch of `size` intents (5-60 characters) through the vectorized pulse path."""
+    from core_physics.auditor_logic import AuditorLogic
+    auditor = AuditorLogic(observer_mass=80, vacuum_index=-1)
+    rng = random.Random(size)
+    intents = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz ') for _ in range(rng.randint(5, 60)))
+               for _ in range(size)]
+    return lambda: auditor.intent_purities(intents)
+
+@benchmark("clock.tick", sizes=[1, 100])
+def _clock_tick(size):
+    """`size` consecutive ticks."""
+    from core_physics.universal_clock import UniversalClock
+    clock = UniversalClock(observer_mass_kg=80, vacuum_index=-1)
+    def run():
+        for _ in range(size):
+            clock.tick()
+    return run
+
+@benchmark("neuro.get_purity", sizes=[1, 100])
+def _neuro_purity(size):
+    from core_physics.neuro_state import NeuroSubsystem
+    pfc = NeuroSubsystem(np.array([1, 1]) / np.sqrt(2))
+    def run():
+        for _ in range(size):
+            pfc.get_purity()
+    return run
+
+@benchmark("neuro.apply_error_correction", sizes=[1, 100])
+def _neuro_correction(size):
+    from core_physics.neuro_state import NeuroSubsystem
+    pfc = NeuroSubsystem(np.array([1, 0]))
+    reference = np.outer([1, 0], [1, 0])
+    def run():
+        for _ in range(size):
+            pfc.depolarize(0.3)
+            pfc.apply_error_correction(reference)
+    return run
+
+@benchmark("render.manifest_object", sizes=[1, 10])
+def _manifest_object(size):
+    """`size` single-shot Aer renders."""
+    from core_physics.reality_render import RealityRenderer
+    renderer = RealityRenderer(backend="aer")
+    renderer.manifest_object(0.5) # warm the compiled-circuit cache and the simulator
+    def run():
+        for _ in range(size):
+            renderer.manifest_object(0.7)
+    return run
+
+@benchmark("bell.run_bell_test", sizes=[1024, 65536])
+def _bell_test(size):
+    """One Bell run with `size` shots."""
+    from core_physics.bell_test import run_bell_test
+    run_bell_test(16)
+    return lambda: run_bell_test(size)
+
+@benchmark("oscillator.LadderOperator", sizes=[10, 1000, 100000])
+def _ladder(size):
+    """Constructing a ladder operator of dimension `size`."""
+    from core_physics.harmonic_oscillator import LadderOperator
+    return lambda: LadderOperator(size, kind='creation')
+
+@benchmark("bayes.calculate_bayes_factor", sizes=[100, 10000, 1000000])
+def _bayes(size):
+    """One Bayes Factor for `size` trials at a 52% hit rate."""
+    from speculative_math.bayesian_psi import calculate_bayes_factor
+    return lambda: calculate_bayes_factor(int(0.52 * size), size)
+
+def time_callable(func, repeat=5, min_time=0.05):
+    """
+    Best and median seconds per call. The call count per repeat is calibrated so
+    one repeat takes at least `min_time` seconds.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed <= 0 else max(2, int(min_time / elapsed) + 1)
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return {"best": min(samples), "median": statistics.median(samples), "calls": number * repeat}
+
+def run_benchmarks(names=None, quick=False, repeat=5, min_time=0.05):
+    """Runs the selected benchmarks; quick=True only times the smallest size of each."""
+    results = []
+    for name, (sizes, setup) in BENCHMARKS.items():
+        if names and not any(pattern in name for pattern in names):
+            continue
+        for size in (sizes[:1] if quick else sizes):
+            timing = time_callable(setup(size), repeat=repeat, min_time=min_time)
+            results.append(dict(name=name, size=size, **timing))
+            print(f"  {name:<32} size={size:<8} best={timing['best'] * 1e6:12.2f} us")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+def compare_results(current, baseline, tolerance=0.25):
+    """
+    Matches results by (name, size) and flags any whose best time grew by more
+    than `tolerance` (0.25 = 25% slower) relative to the baseline.
+    """
+    previous = {(r["name"], r["size"]): r for r in baseline["results"]}
+    report = []
+    for result in current["results"]:
+        key = (result["name"], result["size"])
+        if key not in previous:
+            continue
+        ratio = result["best"] / previous[key]["best"]
+        report.append({"name": key[0], "size": key[1], "ratio": ratio,
+                       "regression": ratio > 1 + tolerance})
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the Quantum-Sandbox hot paths.")
+    parser.add_argument('--filter', nargs='*', help="Only run benchmarks whose name contains one of these.")
+    parser.add_argument('--quick', action='store_true', help="Smallest size of each benchmark only.")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help="Write results as JSON to this path.")
+    parser.add_argument('--baseline', help="JSON results to compare against.")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed slowdown before flagging (0.25 = 25%%).")
+    args = parser.parse_args(argv)
+
+    print("⏱️  Running benchmarks...")
+    current = run_benchmarks(args.filter, quick=args.quick, repeat=args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(current, handle, indent=2)
+        print(f"✅ Results saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            report = compare_results(current, json.load(handle), args.tolerance)
+        for row in report:
+            flag = "❌ REGRESSION" if row["regression"] else "✅"
+            print(f"  {flag} {row['name']} size={row['size']}: {row['ratio']:.2f}x baseline")
+        if any(row["regression"] for row in report):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
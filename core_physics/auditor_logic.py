@@ -1,14 +1,112 @@
+import os
+import asyncio
 import numpy as np
 from core_physics.universal_clock import UniversalClock
-from core_physics.neuro_state import NeuroSubsystem
+from core_physics.neuro_state import NeuroSubsystem, BlochNeuroSubsystem
+from core_physics.random_streams import make_rng
+from core_physics.braid_log import BraidLog
+from core_physics.braid_ring import BraidRing
+from core_physics.intent_ingest import document_features, iter_window_features
+
+# Jacobi sweeps the vectorized recurrence may spend before handing the rest to the scalar loop.
+MAX_SWEEPS = 64
+
+def _affine_scan(scale, offset, start):
+    """x[k] = scale[k] * x[k - 1] + offset[k] with x[-1] = start, in log2(n) doubling steps."""
+    scale, offset = scale.copy(), offset.copy()
+    shift = 1
+    while shift < len(scale):
+        offset[shift:] += scale[shift:] * offset[:-shift]
+        scale[shift:] *= scale[:-shift]
+        shift *= 2
+    return scale * start + offset
+
+def _diagonal_pulses(noise_levels, a, d, ra, rd):
+    """
+    Populations (a, d) after each pulse for a diagonal observer and reference,
+    bit-for-bit those of the scalar pulse loop.
+
+    With the correction gains fixed every pulse is an affine map, so a prefix scan
+    gives a close guess. Jacobi sweeps (every pulse recomputed at once from its
+    predecessor, with the scalar loop's exact operations) then polish the guess;
+    a sweep that changes nothing proves the sequence is the loop's own.
+    """
+    keep, floor = 1 - noise_levels, noise_levels * 0.5
+    corrected = noise_levels > 0.10
+    n_pulses = len(noise_levels)
+
+    gains = np.where(corrected, 0.5, 0.0)
+    for _ in range(2):
+        scale, offset = (1 - gains) * keep, (1 - gains) * floor
+        pop_a = _affine_scan(scale, offset + gains * ra, a)
+        pop_d = _affine_scan(scale, offset + gains * rd, d)
+        depolarized_a = keep * np.concatenate(([a], pop_a[:-1])) + floor
+        depolarized_d = keep * np.concatenate(([d], pop_d[:-1])) + floor
+        purity = depolarized_a * depolarized_a + depolarized_d * depolarized_d
+        guessed = np.where(corrected, np.where(purity < 0.85, 0.5, 0.2), 0.0)
+        if np.array_equal(guessed, gains):
+            break
+        gains = guessed
+
+    # Pulses before `start` are exact; the one at `start` follows from the exact (prev_a, prev_d).
+    start, prev_a, prev_d = 0, a, d
+    for _ in range(MAX_SWEEPS):
+        if start == n_pulses:
+            return pop_a, pop_d
+        window = slice(start, n_pulses)
+        a_in = np.concatenate(([prev_a], pop_a[start:-1]))
+        d_in = np.concatenate(([prev_d], pop_d[start:-1]))
+        new_a = keep[window] * a_in + floor[window]
+        new_d = keep[window] * d_in + floor[window]
+        gain = np.where(new_a * new_a + new_d * new_d < 0.85, 0.5, 0.2)
+        fix = corrected[window]
+        new_a = np.where(fix, (1 - gain) * new_a + gain * ra, new_a)
+        new_d = np.where(fix, (1 - gain) * new_d + gain * rd, new_d)
+        changed = np.flatnonzero((new_a != pop_a[window]) | (new_d != pop_d[window]))
+        pop_a[window], pop_d[window] = new_a, new_d
+        # Everything up to and including the first change is now consistent with its predecessor.
+        start += int(changed[0]) + 1 if changed.size else n_pulses - start
+        prev_a, prev_d = pop_a[start - 1], pop_d[start - 1]
+
+    # Slow convergence: finish the unsettled tail with the scalar loop.
+    a, d = float(prev_a), float(prev_d)
+    for k in range(start, n_pulses):
+        noise_level = noise_levels[k].item()
+        keep_k, floor_k = 1 - noise_level, noise_level * 0.5
+        a = keep_k * a + floor_k
+        d = keep_k * d + floor_k
+        if noise_level > 0.10:
+            gain = 0.5 if a * a + d * d < 0.85 else 0.2
+            a = (1 - gain) * a + gain * ra
+            d = (1 - gain) * d + gain * rd
+        pop_a[k], pop_d[k] = a, d
+    return pop_a, pop_d
 
 class AuditorLogic:
-    def __init__(self, observer_mass=70, vacuum_index=-1):
-        self.clock = UniversalClock(observer_mass_kg=observer_mass, vacuum_index=vacuum_index)
+    def __init__(self, observer_mass=70, vacuum_index=-1, compact=False, seed=None, braid_log=None,
+                 braid_window=5):
+        """
+        compact: Track the observer as a BlochNeuroSubsystem (3 floats, no
+        2x2 arrays allocated per pulse) instead of a full density matrix.
+        seed: Seed (int, SeedSequence or numpy Generator) for the auditor's
+        random stream; the clock environment draws from it.
+        braid_log: BraidLog (or its directory) that every pulse is also appended to.
+        braid_window: Pulses held in the in-memory braid (the receipt's evaluation window).
+        """
+        self.settings = {"observer_mass": observer_mass, "vacuum_index": vacuum_index,
+                         "compact": compact, "braid_window": braid_window}
+        self.braid_log = BraidLog(braid_log) if isinstance(braid_log, (str, os.PathLike)) else braid_log
+        self.rng = make_rng(seed)
+        self.clock = UniversalClock(observer_mass_kg=observer_mass, vacuum_index=vacuum_index, seed=self.rng)
         self.ideal_intent = np.array([1, 0])
         self.reference_rho = np.outer(self.ideal_intent, np.conj(self.ideal_intent))
-        self.observer = NeuroSubsystem(self.ideal_intent)
-        self.topological_braid = []
+        if compact:
+            self.observer = BlochNeuroSubsystem(self.ideal_intent)
+            self.reference_signal = BlochNeuroSubsystem.bloch_from_rho(self.reference_rho)
+        else:
+            self.observer = NeuroSubsystem(self.ideal_intent)
+            self.reference_signal = self.reference_rho
+        self.topological_braid = BraidRing(braid_window)
 
     def audit_environment(self):
         system_report = self.clock.tick()
@@ -17,6 +115,70 @@ class AuditorLogic:
         interference_penalty = len(system_report["Interrupts"]) * 0.02 
         return dilation, interference_penalty
 
+    def audit_environment_batch(self, n_pulses):
+        """Pre-draws the clock environment for n pulses (same stream as n audit_environment calls)."""
+        system_report = self.clock.tick_many(n_pulses)
+        return system_report["Dilation_Factor"], system_report["Interrupt_Count"] * 0.02
+
+    @staticmethod
+    def intent_features(raw_input_strings):
+        """
+        Vectorized (unique_chars, total_chars, ordinal_sum) for a batch of strings:
+        the same numbers as len(set(s)), len(s) and sum(map(ord, s)), NULs included.
+        The strings are joined into one code-point buffer (no padding), so memory
+        follows the total length of the batch, not its longest string; ASCII
+        batches use one byte per character and a 128-slot table per string.
+        """
+        strings = list(raw_input_strings)
+        total_chars = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+        joined = "".join(strings)
+        ascii_only = joined.isascii()
+        if ascii_only:
+            codes = np.frombuffer(joined.encode("ascii"), dtype=np.uint8)
+        else:
+            codes = np.frombuffer(joined.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+        filled = total_chars > 0
+        starts = (np.cumsum(total_chars) - total_chars)[filled]
+
+        def per_string(values):
+            # Segment sums; empty strings have no segment and stay 0
+            sums = np.zeros(len(strings), dtype=np.int64)
+            sums[filled] = np.add.reduceat(values, starts, dtype=np.int64)
+            return sums
+
+        ordinal_sum = per_string(codes)
+
+        if ascii_only:
+            # Distinct characters: mark a 128-slot table per string (N x 128 bytes)
+            slots = np.repeat(np.arange(0, 128 * len(strings), 128, dtype=np.int64), total_chars)
+            slots += codes
+            seen = np.zeros(128 * len(strings), dtype=bool)
+            seen[slots] = True
+            return np.count_nonzero(seen.reshape(-1, 128), axis=1), total_chars, ordinal_sum
+
+        # Distinct code points: sort (string, code point) keys and count the changes per string
+        alphabet = int(codes.max()) + 1 if codes.size else 1
+        key_type = np.uint32 if len(strings) * alphabet <= 1 << 32 else np.uint64
+        rows = np.repeat(np.arange(len(strings), dtype=key_type), total_chars)
+        keys = np.sort(rows * key_type(alphabet) + codes)
+        changes = np.ones(keys.shape, dtype=bool)
+        changes[1:] = keys[1:] != keys[:-1]
+        unique_chars = per_string(changes)
+
+        return unique_chars, total_chars, ordinal_sum
+
+    @staticmethod
+    def entropy_tilt(unique_chars, total_chars, ordinal_sum):
+        """Vectorized Goldilocks Gate + ordinal tilt (scalars or arrays)."""
+        unique_chars = np.asarray(unique_chars)
+        total_chars = np.asarray(total_chars)
+        char_variance = np.divide(unique_chars, total_chars,
+                                  out=np.zeros(total_chars.shape), where=total_chars > 0)
+
+        # GOLDILOCKS GATE: Slop filtering based on complexity
+        spirit_penalty = np.where((char_variance < 0.35) | (char_variance > 0.85), 0.5, 0.02)
+        return (np.asarray(ordinal_sum) % 50 / 100.0) + spirit_penalty
+
     def process_intent_state(self, raw_input_string):
         """
         State-Sync Discriminator: Converts strings to non-linear state pulses.
@@ -38,34 +200,233 @@ class AuditorLogic:
         noise_level = 0.05 + penalty + entropy_tilt
         
         # Interaction with the field
-        self.observer.rho = (1 - noise_level) * self.observer.rho + \
-                            (noise_level) * np.eye(2) * 0.5
+        self.observer.depolarize(noise_level)
         
         # TESLA BYPASS: Instant correction pulse
         if noise_level > 0.10:
-            self.observer.apply_error_correction(self.reference_rho)
+            self.observer.apply_error_correction(self.reference_signal)
         
         purity = self.observer.get_purity()
         
-        self.topological_braid.append({
-            "purity": purity,
-            "dilation": dilation,
-            "locked": purity > 0.88 
-        })
+        self.topological_braid.append(purity, dilation)
+        if self.braid_log is not None:
+            self.braid_log.append(purity, dilation)
 
         return {
             "purity_score": purity,
             "causal_status": "SYNCHRONIZED" if purity > 0.88 else "DECOHERED"
         }
 
+    def process_intents(self, raw_input_strings):
+        """
+        Batch State-Sync: same pulses as calling process_intent_state on each
+        string in order, with the features, clock environment and 2x2
+        density-matrix recurrence computed in bulk.
+        """
+        return self.pulse_results(self.intent_purities(raw_input_strings))
+
+    def intent_purities(self, raw_input_strings):
+        """
+        process_intents without the per-pulse dicts: the purity of every pulse
+        as one array (the fast path for large batches).
+        """
+        return self._pulse_features(*self.intent_features(raw_input_strings))
+
+    def audit_document(self, source, chunk_size=1 << 20, encoding="utf-8"):
+        """
+        One State-Sync pulse for a whole document (file path, bytes-like object or
+        iterable of chunks; see intent_ingest). The character features are
+        accumulated chunk by chunk, so multi-GB transcripts stream through in
+        bounded memory. Same pulse as process_intent_state(full_text).
+        """
+        features = document_features(source, chunk_size, encoding)
+        return self.pulse_results(self._pulse_features(*(np.array([value], dtype=np.int64) for value in features)))[0]
+
+    def audit_windows(self, source, window, step=None, chunk_size=1 << 20, encoding="utf-8"):
+        """
+        Streams a document and yields one pulse result per sliding window of
+        `window` characters (every `step` characters; non-overlapping by default).
+        Windows are pulsed in document order, batch by batch as chunks arrive.
+        """
+        for features in iter_window_features(source, window, step, chunk_size, encoding):
+            yield from self.pulse_results(self._pulse_features(*features))
+
+    def _pulse_features(self, unique_chars, total_chars, ordinal_sum):
+        """
+        The batched pulse recurrence over precomputed (unique, total, ordinal_sum)
+        feature arrays. Returns the purity of every pulse as an array.
+        """
+        n_pulses = len(total_chars)
+        if n_pulses == 0:
+            return np.zeros(0)
+
+        dilation, penalties = self.audit_environment_batch(n_pulses)
+        noise_levels = 0.05 + penalties + self.entropy_tilt(unique_chars, total_chars, ordinal_sum)
+        self._on_correction_pulses(int(np.count_nonzero(noise_levels > 0.10)))
+
+        # Closed-form 2x2 recurrence: mixing with I/2 only touches the diagonal.
+        (a, b), (c, d) = self.observer.rho.tolist()
+        (ra, rb), (rc, rd) = self.reference_rho.tolist()
+        if b == c == rb == rc == 0 and a.imag == d.imag == ra.imag == rd.imag == 0:
+            # Real diagonal observer and reference: the coherences stay zero and the
+            # populations follow one vectorized recurrence.
+            pop_a, pop_d = _diagonal_pulses(noise_levels, a.real, d.real, ra.real, rd.real)
+            purities = pop_a * pop_a + pop_d * pop_d
+            a, d = pop_a[-1].item(), pop_d[-1].item()
+        else:
+            purities = []
+            for noise_level in noise_levels.tolist():
+                keep, floor = 1 - noise_level, noise_level * 0.5
+                a = keep * a + floor
+                b = keep * b
+                c = keep * c
+                d = keep * d + floor
+
+                # TESLA BYPASS: Instant correction pulse
+                if noise_level > 0.10:
+                    gain = 0.5 if (a * a + b * c + c * b + d * d).real < 0.85 else 0.2
+                    a = (1 - gain) * a + gain * ra
+                    b = (1 - gain) * b + gain * rb
+                    c = (1 - gain) * c + gain * rc
+                    d = (1 - gain) * d + gain * rd
+
+                purities.append((a * a + b * c + c * b + d * d).real)
+            purities = np.array(purities)
+
+        self.observer.rho = np.array([[a, b], [c, d]])
+
+        self.topological_braid.extend(purities, dilation)
+        if self.braid_log is not None:
+            self.braid_log.append(purities, dilation)
+        return purities
+
+    @staticmethod
+    def pulse_results(purities):
+        """Result dicts ({'purity_score', 'causal_status'}) for an array of pulse purities."""
+        return [
+            {"purity_score": purity, "causal_status": "SYNCHRONIZED" if purity > 0.88 else "DECOHERED"}
+            for purity in np.asarray(purities).tolist()
+        ]
+
+    def _on_correction_pulses(self, count):
+        """Hook: number of Tesla Bypass pulses fired by one batched recurrence (instrumentation wraps it)."""
+
+    async def process_stream(self, intents, batch_size=32, max_queue=256):
+        """
+        Async State-Sync pipeline for a continuous intent feed.
+
+        Consumes an async iterable of intent strings, micro-batches whatever has
+        arrived (up to batch_size) and yields one result per intent, in order.
+        Ingestion runs as its own task behind a bounded queue (backpressure at
+        max_queue), while each batch is computed in a worker thread so the feed
+        keeps flowing. Batches run one at a time, so the density-matrix
+        recurrence sees intents in exactly the same order as sequential calls.
+        """
+        queue = asyncio.Queue(maxsize=max_queue)
+        end_of_stream = object()
+
+        async def ingest():
+            try:
+                async for intent in intents:
+                    await queue.put(intent)
+            except asyncio.CancelledError:
+                # The consumer stopped early: nobody is left to read a sentinel,
+                # and putting one on a full queue would block forever.
+                raise
+            except Exception:
+                await queue.put(end_of_stream)
+                raise
+            await queue.put(end_of_stream)
+
+        loop = asyncio.get_running_loop()
+        producer = asyncio.create_task(ingest())
+        try:
+            finished = False
+            while not finished:
+                batch = [await queue.get()]
+                while len(batch) < batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+                if batch[-1] is end_of_stream:
+                    batch.pop()
+                    finished = True
+
+                if batch:
+                    results = await loop.run_in_executor(None, self._process_batch, batch)
+                    for result in results:
+                        yield result
+
+            # Surface any error raised by the intent source itself.
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                try:
+                    await producer
+                except asyncio.CancelledError:
+                    pass
+
+    def _process_batch(self, batch):
+        return self.process_intents(batch)
+
+    def checkpoint(self):
+        """
+        Saves everything needed to resume this auditor next to its braid log:
+        observer rho, clock state and random-stream position.
+        """
+        if self.braid_log is None:
+            raise ValueError("Checkpoints are saved next to the braid log: construct the auditor with braid_log=<directory>.")
+        clock = self.clock
+        self.braid_log.checkpoint(
+            rho=self.observer.rho,
+            entropy_state=clock.entropy_state,
+            total_planck_ticks=clock.total_planck_ticks,
+            solar_flare_active=clock.solar_flare_active,
+            rng=self.rng.bit_generator.state,
+            settings=self.settings,
+        )
+
+    @classmethod
+    def resume(cls, directory):
+        """
+        Rebuilds an auditor from the last checkpoint in a braid log directory.
+        Pulses logged after that checkpoint are dropped from the log (the observer
+        state they came from was never saved); the in-memory braid window is
+        refilled from the log's tail and its lifetime counts from the full log.
+        """
+        log = BraidLog(directory)
+        state = log.load_checkpoint()
+        if state is None:
+            raise FileNotFoundError(f"No braid checkpoint in {directory}")
+
+        rng_state = state["rng"]
+        bit_generator = getattr(np.random, rng_state["bit_generator"])()
+        bit_generator.state = rng_state
+        auditor = cls(**state["settings"], seed=np.random.Generator(bit_generator), braid_log=log)
+
+        log.truncate(state["pulses"])
+        auditor.observer.rho = state["rho"]
+        auditor.clock.entropy_state = state["entropy_state"]
+        auditor.clock.total_planck_ticks = state["total_planck_ticks"]
+        auditor.clock.solar_flare_active = state["solar_flare_active"]
+        window = auditor.topological_braid.window
+        auditor.topological_braid.restore(
+            log.column("purity")[-window:], log.column("dilation")[-window:],
+            total_pulses=len(log), total_locks=int(np.count_nonzero(log.column("locked"))),
+        )
+        return auditor
+
+    def coherence_summary(self):
+        """O(1) rolling statistics of the braid window plus lifetime pulse and lock counts."""
+        return self.topological_braid.summary()
+
     def generate_stargate_receipt(self):
         if not self.topological_braid: return "NO_DATA"
         
         # EVALUATION: Look at the peak stability of the braid
         # If the observer achieves a lock at any point in the recent pulses, 
         # the metric fold is validated.
-        recent_purity = [b["purity"] for b in self.topological_braid[-5:]]
-        max_stability = max(recent_purity)
+        # The braid window holds exactly the recent pulses and tracks their peak as it goes.
+        max_stability = self.topological_braid.max_purity
         
         if max_stability > 0.90: 
             return "RECEIPT: Metric Fold Successful. Information Tunnel Open."
@@ -1,8 +1,32 @@
+import math
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
+from core_physics.circuit_registry import registry, get_simulator
+from core_physics.wave_mechanics import StateVector
+from core_physics.random_streams import spawn_seeds
 
-def run_bell_test(num_shots=1024):
+def _run_shard(shots, seed, backend):
+    """Runs one shard of Bell-pair shots (module-level so a process pool can pickle it)."""
+    if backend == "statevector":
+        return StateVector(2).h(0).cx(0, 1).sample_counts(shots, np.random.default_rng(seed))
+
+    simulator = get_simulator()
+
+    # Step 1: Create the Entangled Circuit (The Bell State)
+    # Using 'H' (Hadamard) and 'CNOT' to create: (|00> + |11>) / sqrt(2)
+    # Step 2: Measure in the Standard Basis
+    # If the link is real, q0 and q1 will always match (00 or 11).
+    # Both steps live in the shared 'bell_pair' template, compiled once per backend (and process).
+    qc = registry.compiled("bell_pair", simulator)
+
+    job = simulator.run(qc, shots=shots, seed_simulator=seed)
+    result = job.result()
+    # Plain dict: unpickling Qiskit's Counts would import Qiskit in the pool's result thread.
+    return dict(result.get_counts())
+
+def run_bell_test(num_shots=1024, backend="aer", seed=None, shard_size=None, workers=1, merge=True):
     """
     Simulates a Bell Pair measurement to verify Entanglement Correlation.
     
@@ -11,27 +35,85 @@ def run_bell_test(num_shots=1024):
     
     To prove 'Non-Locality' (CHSH Violation), we would rotate the bases 
     by the 'Sweet Spot' angles: [0, pi/4, pi/2, 3pi/4].
-    For this module, we focus on establishing the link (Correlation = 1.0).
+    That is what `run_chsh_sweep` does; here we only establish the link (Correlation = 1.0).
+
+    backend: "aer" (AerSimulator job) or "statevector" (in-process StateVector,
+    no job overhead for this 2-qubit circuit).
+    seed: Int, SeedSequence or numpy Generator; makes the run reproducible.
+    shard_size: Splits the shots into shards of this many shots (the last one
+        takes the remainder), each with its own seed spawned from `seed`.
+        None = one shard.
+    workers: Processes the shards run in (1 = this process). Shard boundaries
+        and seeds depend only on num_shots, shard_size and seed, so the same
+        seed gives the same counts for any worker count.
+    merge: False returns the list of per-shard counts instead of their sum.
     """
-    simulator = AerSimulator()
-    
-    # Step 1: Create the Entangled Circuit (The Bell State)
-    # Using 'H' (Hadamard) and 'CNOT' to create: (|00> + |11>) / sqrt(2)
-    qc = QuantumCircuit(2, 2)
-    qc.h(0)       # Put q0 into Superposition
-    qc.cx(0, 1)   # Entangle q1 with q0
-    
-    # Step 2: Measure in the Standard Basis
-    # If the link is real, q0 and q1 will always match (00 or 11).
-    qc.measure([0, 1], [0, 1])
-    
-    job = simulator.run(qc, shots=num_shots)
-    result = job.result()
-    counts = result.get_counts()
-    
-    return counts
+    shard_size = num_shots if shard_size is None else shard_size
+    shots = [min(shard_size, num_shots - start) for start in range(0, num_shots, shard_size)]
+    seeds = spawn_seeds(seed, len(shots))
+
+    if workers <= 1 or len(shots) <= 1:
+        shards = [_run_shard(n, s, backend) for n, s in zip(shots, seeds)]
+    else:
+        # Spawned (not forked) workers: forking a process that already holds
+        # Qiskit's native thread pools can deadlock or crash.
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            shards = list(pool.map(_run_shard, shots, seeds, [backend] * len(shots)))
+
+    if not merge:
+        return shards
+    return merge_counts(shards)
 
-def calculate_correlation(counts):
+def merge_counts(shards):
+    """Exact sum of per-shard counts dicts."""
+    merged = Counter()
+    for counts in shards:
+        merged.update(counts)
+    return dict(merged)
+
+def run_chsh_sweep(angle_pairs, num_shots=1024, seed=None):
+    """
+    Measures the CHSH value S for a whole grid of measurement settings.
+
+    angle_pairs: array-like of shape (N, 2, 2), one ((a, a2), (b, b2)) per entry:
+    Alice's two basis angles and Bob's two basis angles (radians, X-Z plane).
+
+    All 4N basis-rotation circuits are bound from the one compiled 'chsh'
+    template and submitted as a single batched Aer job.
+    seed: Int, SeedSequence or numpy Generator; makes the run reproducible.
+
+    Returns:
+    - "correlators": (N, 4) array of E(a,b), E(a,b2), E(a2,b), E(a2,b2)
+    - "S": (N,) array, S = E(a,b) - E(a,b2) + E(a2,b) + E(a2,b2)
+      |S| <= 2 classically; the sweet spot (a, a2, b, b2) = (0, pi/2, pi/4, 3pi/4)
+      reaches 2*sqrt(2) (Tsirelson bound).
+    """
+    settings = np.asarray(angle_pairs, dtype=float).reshape(-1, 2, 2)
+    alice, bob = settings[:, 0, :], settings[:, 1, :]
+
+    # Expand every entry into its 4 settings: (a,b), (a,b2), (a2,b), (a2,b2)
+    alphas = np.repeat(alice, 2, axis=1).ravel()
+    betas = np.tile(bob, (1, 2)).ravel()
+
+    simulator = get_simulator()
+    qc = registry.compiled("chsh", simulator)
+    binds = registry.parameter_binds("chsh", simulator, alpha=alphas, beta=betas)
+    result = simulator.run(qc, parameter_binds=binds, shots=num_shots,
+                           seed_simulator=spawn_seeds(seed, 1)[0]).result()
+
+    # (4N, 4) table of outcome counts in the order 00, 01, 10, 11
+    table = np.array([
+        [c.get(k, 0) for k in ('00', '01', '10', '11')]
+        for c in (result.get_counts(i) for i in range(len(alphas)))
+    ], dtype=float)
+
+    correlators = ((table[:, 0] + table[:, 3] - table[:, 1] - table[:, 2])
+                   / table.sum(axis=1)).reshape(-1, 4)
+    s_values = correlators @ np.array([1.0, -1.0, 1.0, 1.0])
+
+    return {"correlators": correlators, "S": s_values}
+
+def calculate_correlation(counts, standard_error=False):
     """
     Calculates the Correlation Coefficient.
     
@@ -39,15 +121,22 @@ def calculate_correlation(counts):
     - Agreements (00, 11): The qubits 'mirrored' each other.
     - Disagreements (01, 10): The link failed (Noise/Decoherence).
     
+    counts: A counts dict, or a list of per-shard counts dicts (merged exactly first).
+    standard_error: Also return the standard error sqrt((1 - E^2) / shots) of the estimate.
+
     Returns:
     - 1.0: Perfect Entanglement (The Mirror Link)
     - 0.0: No Link (Random Noise)
     """
+    if not isinstance(counts, dict):
+        counts = merge_counts(counts)
     total = sum(counts.values())
     agreements = counts.get('00', 0) + counts.get('11', 0)
     disagreements = counts.get('01', 0) + counts.get('10', 0)
     
     correlation = (agreements - disagreements) / total
+    if standard_error:
+        return correlation, math.sqrt(max(0.0, 1 - correlation ** 2) / total)
     return correlation
 
 if __name__ == "__main__":
@@ -0,0 +1,197 @@
+import os
+import io
+import json
+import time
+import numpy as np
+
+# One raw little-endian file per column, plus a one-slot counter of committed rows.
+COLUMNS = {
+    "seq": np.dtype("<u8"),
+    "timestamp": np.dtype("<f8"),
+    "purity": np.dtype("<f8"),
+    "dilation": np.dtype("<f8"),
+    "locked": np.dtype("?"),
+}
+LOCK_THRESHOLD = 0.88
+
+class BraidLog:
+    """
+    Append-only, memory-mapped columnar log of the topological braid.
+
+    Each column lives in '<directory>/<column>.bin' and 'count.bin' holds the number
+    of committed pulses. Rows are written first and the count is bumped last, so a
+    reader (mode='r') sees a consistent prefix while the writer keeps appending;
+    refresh() picks up newly committed rows. Capacity doubles as the log grows.
+    """
+    def __init__(self, directory, mode="a", capacity=1 << 16):
+        """
+        mode: 'a' creates or appends (one writer), 'r' opens read-only (any number of readers).
+        capacity: Initial rows reserved per column for a new log.
+        """
+        if mode not in ("a", "r"):
+            raise ValueError(f"Unknown braid log mode '{mode}'. Choose 'a' or 'r'.")
+        self.directory = directory
+        self.mode = mode
+        if mode == "a":
+            os.makedirs(directory, exist_ok=True)
+            if not os.path.exists(self._path("count")):
+                for name, dtype in COLUMNS.items():
+                    self._allocate(name, capacity * dtype.itemsize)
+                self._allocate("count", 8)
+        self._count_map = np.memmap(self._path("count"), dtype="<u8", mode="r+" if mode == "a" else "r", shape=(1,))
+        self._count = self._count_map.view(np.ndarray)
+        self._map_columns()
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{name}.bin")
+
+    def _allocate(self, name, size):
+        with open(self._path(name), "ab") as handle:
+            handle.truncate(size)
+
+    def _map_columns(self):
+        access = "r+" if self.mode == "a" else "r"
+        self._columns = {}
+        for name, dtype in COLUMNS.items():
+            rows = os.path.getsize(self._path(name)) // dtype.itemsize
+            # Plain ndarray views of the maps: same pages, without np.memmap's per-slice overhead.
+            self._columns[name] = np.memmap(self._path(name), dtype=dtype, mode=access, shape=(rows,)).view(np.ndarray)
+        self.capacity = min(len(column) for column in self._columns.values())
+
+    def _reserve(self, rows):
+        if rows <= self.capacity:
+            return
+        capacity = max(self.capacity, 1)
+        while capacity < rows:
+            capacity *= 2
+        self.flush()
+        self._columns = {}
+        for name, dtype in COLUMNS.items():
+            self._allocate(name, capacity * dtype.itemsize)
+        self._map_columns()
+
+    def __len__(self):
+        return int(self._count[0])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, purity, dilation, timestamp=None):
+        """
+        Appends one pulse or a batch (purity array; dilation scalar or matching array).
+        Returns the sequence number of the first appended pulse.
+        """
+        start = len(self)
+        timestamp = time.time() if timestamp is None else timestamp
+        if np.ndim(purity) == 0:
+            # Single pulse: plain item assignment.
+            self._reserve(start + 1)
+            columns = self._columns
+            columns["seq"][start] = start
+            columns["timestamp"][start] = timestamp
+            columns["purity"][start] = purity
+            columns["dilation"][start] = dilation
+            columns["locked"][start] = purity > LOCK_THRESHOLD
+            self._count[0] = start + 1
+            return start
+
+        purity = np.asarray(purity, dtype=float)
+        stop = start + len(purity)
+        self._reserve(stop)
+        columns = self._columns
+        columns["seq"][start:stop] = np.arange(start, stop)
+        columns["timestamp"][start:stop] = timestamp
+        columns["purity"][start:stop] = purity
+        columns["dilation"][start:stop] = dilation
+        columns["locked"][start:stop] = purity > LOCK_THRESHOLD
+        # Commit: readers only look below the count.
+        self._count[0] = stop
+        return start
+
+    def truncate(self, n_pulses):
+        """Forgets every pulse from n_pulses on (they are overwritten by the next append)."""
+        self._count[0] = min(int(n_pulses), len(self))
+
+    def refresh(self):
+        """Remaps the columns if the writer has grown them (readers call this to follow along)."""
+        if any(os.path.getsize(self._path(name)) // dtype.itemsize != len(self._columns[name])
+               for name, dtype in COLUMNS.items()):
+            self._map_columns()
+        return len(self)
+
+    def _committed(self):
+        """Committed row count, remapping first if the writer has outgrown our mapping."""
+        count = len(self)
+        if count > self.capacity:
+            self._map_columns()
+        return count
+
+    def column(self, name):
+        """Zero-copy view of one column's committed rows."""
+        return self._columns[name][:self._committed()]
+
+    def columns(self):
+        count = self._committed()
+        return {name: column[:count] for name, column in self._columns.items()}
+
+    def tail(self, n_pulses):
+        """The last n pulses as braid entries ({'purity', 'dilation', 'locked'} dicts)."""
+        stop = self._committed()
+        start = max(0, stop - n_pulses)
+        purity = self._columns["purity"][start:stop].tolist()
+        dilation = self._columns["dilation"][start:stop].tolist()
+        locked = self._columns["locked"][start:stop].tolist()
+        return [{"purity": p, "dilation": d, "locked": l} for p, d, l in zip(purity, dilation, locked)]
+
+    def flush(self):
+        if self.mode == "a":
+            for column in self._columns.values():
+                column.base.flush()
+            self._count_map.flush()
+
+    def close(self):
+        self.flush()
+        self._columns = {}
+
+    # CHECKPOINTS
+    @property
+    def checkpoint_path(self):
+        return os.path.join(self.directory, "checkpoint.npz")
+
+    def checkpoint(self, **state):
+        """
+        Flushes the log and atomically saves `state` (arrays, numbers, or JSON-able
+        dicts) together with the current pulse count.
+        """
+        self.flush()
+        arrays = {"pulses": np.uint64(len(self))}
+        for key, value in state.items():
+            arrays[key] = np.array(json.dumps(value)) if isinstance(value, dict) else np.asarray(value)
+
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+        temporary = self.checkpoint_path + ".tmp"
+        with open(temporary, "wb") as handle:
+            handle.write(buffer.getvalue())
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, self.checkpoint_path)
+
+    def load_checkpoint(self):
+        """The last checkpoint's state as a dict (JSON-encoded dicts decoded), or None."""
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        state = {}
+        with np.load(self.checkpoint_path) as saved:
+            for key in saved.files:
+                value = saved[key]
+                if value.dtype.kind == "U":
+                    state[key] = json.loads(value.item())
+                elif value.ndim == 0:
+                    state[key] = value.item()
+                else:
+                    state[key] = value
+        return state
@@ -0,0 +1,137 @@
+from collections import deque
+import numpy as np
+from core_physics.braid_log import LOCK_THRESHOLD
+
+class BraidRing:
+    """
+    The topological braid as a fixed-capacity ring buffer.
+
+    Only the last `window` pulses are kept (in preallocated arrays), so memory is
+    constant however long the auditor runs. The rolling max (monotonic deque),
+    mean (running sum) and lock count of the window are updated on every append,
+    which makes receipts and coherence summaries O(1). Lifetime pulse and lock
+    counts are kept alongside.
+    """
+    def __init__(self, window=5):
+        if window < 1:
+            raise ValueError("The braid window must hold at least one pulse.")
+        self.window = window
+        self.purity = np.zeros(window)
+        self.dilation = np.zeros(window)
+        self.locked = np.zeros(window, dtype=bool)
+        self.total_pulses = 0
+        self.total_locks = 0
+        self._size = 0
+        self._purity_sum = 0.0
+        self._window_locks = 0
+        self._peaks = deque() # (pulse number, purity), purities strictly decreasing
+
+    def __len__(self):
+        return self._size
+
+    def _slot(self, index):
+        """Ring slot of the index-th held pulse (oldest first, negatives from the newest)."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("braid index out of range")
+        return (self.total_pulses - self._size + index) % self.window
+
+    def __getitem__(self, index):
+        """Braid entries as {'purity', 'dilation', 'locked'} dicts; slices give lists."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        slot = self._slot(index)
+        return {"purity": self.purity[slot].item(), "dilation": self.dilation[slot].item(),
+                "locked": self.locked[slot].item()}
+
+    def __iter__(self):
+        return (self[i] for i in range(self._size))
+
+    def append(self, purity, dilation):
+        slot = self.total_pulses % self.window
+        locked = bool(purity > LOCK_THRESHOLD)
+        if self._size == self.window:
+            # Evict the oldest pulse from the running statistics.
+            self._purity_sum -= self.purity[slot].item()
+            self._window_locks -= int(self.locked[slot])
+        else:
+            self._size += 1
+
+        self.purity[slot] = purity
+        self.dilation[slot] = dilation
+        self.locked[slot] = locked
+        self._purity_sum += float(purity)
+        self._window_locks += locked
+        self.total_locks += locked
+
+        peaks = self._peaks
+        while peaks and peaks[-1][1] <= purity:
+            peaks.pop()
+        peaks.append((self.total_pulses, purity))
+        self.total_pulses += 1
+        if peaks[0][0] <= self.total_pulses - 1 - self.window:
+            peaks.popleft()
+
+        if slot == self.window - 1 and self._size == self.window:
+            # Once per lap, re-sum the window so the running mean cannot drift.
+            self._purity_sum = float(self.purity.sum())
+
+    def extend(self, purities, dilation):
+        """Appends a batch; only its last `window` pulses are copied into the ring."""
+        purities = np.asarray(purities, dtype=float)
+        if len(purities) < self.window:
+            for purity, value in zip(purities.tolist(), np.broadcast_to(dilation, purities.shape).tolist()):
+                self.append(purity, value)
+            return
+
+        dilations = np.broadcast_to(dilation, purities.shape)
+        skipped = len(purities) - self.window
+        self.total_locks += int(np.count_nonzero(purities[:skipped] > LOCK_THRESHOLD))
+        self.total_pulses += skipped
+        # The skipped pulses fall out of the window anyway: restart the ring from the tail.
+        self._size = 0
+        self._purity_sum = 0.0
+        self._window_locks = 0
+        self._peaks.clear()
+        for purity, value in zip(purities[skipped:].tolist(), dilations[skipped:].tolist()):
+            self.append(purity, value)
+
+    def restore(self, purities, dilations, total_pulses, total_locks):
+        """
+        Refills an empty ring from the last pulses of a longer history (e.g. a braid
+        log's tail) plus that history's lifetime pulse and lock counts, so slots and
+        peak pulse numbers line up as if every pulse had been appended.
+        """
+        purities = np.asarray(purities, dtype=float)[-self.window:]
+        dilations = np.broadcast_to(dilations, np.shape(purities))
+        self._size = 0
+        self._purity_sum = 0.0
+        self._window_locks = 0
+        self._peaks.clear()
+        self.total_pulses = total_pulses - len(purities)
+        self.total_locks = total_locks - int(np.count_nonzero(purities > LOCK_THRESHOLD))
+        for purity, value in zip(purities.tolist(), dilations.tolist()):
+            self.append(purity, value)
+
+    @property
+    def max_purity(self):
+        return self._peaks[0][1] if self._peaks else None
+
+    @property
+    def mean_purity(self):
+        return self._purity_sum / self._size if self._size else None
+
+    @property
+    def lock_ratio(self):
+        return self._window_locks / self._size if self._size else None
+
+    def summary(self):
+        return {
+            "pulses": self.total_pulses,
+            "locked_pulses": self.total_locks,
+            "window": self.window,
+            "window_max_purity": self.max_purity,
+            "window_mean_purity": self.mean_purity,
+            "window_lock_ratio": self.lock_ratio,
+        }
@@ -0,0 +1,135 @@
+from collections import OrderedDict
+
+# Qiskit is imported lazily (inside the builders, compiled() and get_simulator())
+# so importing core_physics stays cheap for processes that only need the NumPy math.
+_SIMULATOR = None
+
+def get_simulator():
+    """The shared AerSimulator, created (and qiskit_aer imported) on first use."""
+    global _SIMULATOR
+    if _SIMULATOR is None:
+        from qiskit_aer import AerSimulator
+        _SIMULATOR = AerSimulator()
+    return _SIMULATOR
+
+def build_bell_state():
+    """(|00> + |11>) / sqrt(2): Hadamard on q0, then CNOT onto q1. No measurement."""
+    from qiskit import QuantumCircuit
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    return qc
+
+def build_bell_pair():
+    """The Bell state measured in the standard (Z) basis."""
+    from qiskit import QuantumCircuit
+    qc = QuantumCircuit(2, 2)
+    qc.compose(build_bell_state(), inplace=True)
+    qc.measure([0, 1], [0, 1])
+    return qc
+
+def build_ry_render():
+    """Single-qubit 'intention' rotation RY(theta), then measurement."""
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Parameter
+    theta = Parameter("theta")
+    qc = QuantumCircuit(1, 1)
+    qc.ry(theta, 0)
+    qc.measure(0, 0)
+    return qc
+
+def build_chsh():
+    """
+    Bell state measured along angles alpha (q0) and beta (q1) in the X-Z plane.
+    RY(-angle) rotates each measurement axis back onto Z before readout,
+    so the correlator is E(alpha, beta) = cos(alpha - beta).
+    """
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Parameter
+    alpha = Parameter("alpha")
+    beta = Parameter("beta")
+    qc = QuantumCircuit(2, 2)
+    qc.compose(build_bell_state(), inplace=True)
+    qc.ry(-alpha, 0)
+    qc.ry(-beta, 1)
+    qc.measure([0, 1], [0, 1])
+    return qc
+
+DEFAULT_TEMPLATES = {
+    "bell_state": build_bell_state,
+    "bell_pair": build_bell_pair,
+    "ry_render": build_ry_render,
+    "chsh": build_chsh,
+}
+
+class CircuitRegistry:
+    """
+    Compiled-circuit cache.
+    Templates are built once, transpiled once per backend and kept in an LRU;
+    callers only bind parameter values at run time.
+    """
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._builders = dict(DEFAULT_TEMPLATES)
+        self._templates = {}
+        self._compiled = OrderedDict()
+
+    def register(self, name, builder):
+        """Adds (or replaces) a template builder and drops anything compiled from it."""
+        self._builders[name] = builder
+        self._templates.pop(name, None)
+        for key in [k for k in self._compiled if k[0] == name]:
+            del self._compiled[key]
+
+    def template(self, name):
+        """The raw (untranspiled) parameterized template."""
+        if name not in self._builders:
+            raise KeyError(f"Unknown circuit template '{name}'.")
+        if name not in self._templates:
+            self._templates[name] = self._builders[name]()
+        return self._templates[name]
+
+    def compiled(self, name, backend):
+        """The template transpiled for `backend`, served from the LRU when possible."""
+        key = (name, type(backend).__name__, getattr(backend, "name", None))
+        if key in self._compiled:
+            self.hits += 1
+            self._compiled.move_to_end(key)
+            return self._compiled[key]
+
+        self.misses += 1
+        from qiskit import transpile
+        circuit = transpile(self.template(name), backend)
+        self._compiled[key] = circuit
+        if len(self._compiled) > self.maxsize:
+            self._compiled.popitem(last=False)
+        return circuit
+
+    def bind(self, name, backend, **values):
+        """Compiled circuit with parameters bound by name (e.g. theta=0.5)."""
+        circuit = self.compiled(name, backend)
+        if not values:
+            return circuit
+        return circuit.assign_parameters({p: values[p.name] for p in circuit.parameters})
+
+    def parameter_binds(self, name, backend, **values):
+        """
+        Aer-style `parameter_binds` for running one compiled template over
+        many values in a single job: {Parameter: [v0, v1, ...]}.
+        """
+        circuit = self.compiled(name, backend)
+        return [{p: list(values[p.name]) for p in circuit.parameters}]
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._compiled), "maxsize": self.maxsize}
+
+    def clear(self):
+        self._compiled.clear()
+        self.hits = 0
+        self.misses = 0
+
+# Shared registry: bell_test, reality_render and the asset generator all draw from here.
+registry = CircuitRegistry()
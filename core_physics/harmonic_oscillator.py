@@ -1,21 +1,145 @@
+import hashlib
+from collections import OrderedDict
 import numpy as np
 from core_physics.operators import QuantumOperator
 
-class LadderOperator(QuantumOperator):
+class BandedOperator(QuantumOperator):
+    """
+    A Fock-space operator stored as a few diagonals instead of a dense matrix.
+    bands: {offset: vector}, where vector[t] is the entry at (t, t + offset) for
+    offset >= 0 and at (t - offset, t) for offset < 0 (the np.diag ordering).
+    Applying it to a state costs O(dimension) per band.
+    """
+    def __init__(self, dimension, bands, name="Banded"):
+        self.dimension = dimension
+        self.bands = {k: np.asarray(v) for k, v in bands.items() if abs(k) < dimension}
+        self.name = name
+        self._dense = None
+
+    @property
+    def matrix(self):
+        """Dense matrix, built lazily (only sensible for small dimensions)."""
+        if self._dense is None:
+            dense = np.zeros((self.dimension, self.dimension), dtype=self._dtype())
+            for offset, values in self.bands.items():
+                dense += np.diag(values, offset)
+            self._dense = dense
+        return self._dense
+
+    def _dtype(self):
+        return np.result_type(float, *self.bands.values())
+
+    def _rows(self, offset):
+        """Band as a length-dimension vector indexed by row (zero where the band has no entry)."""
+        rows = np.zeros(self.dimension, dtype=self.bands[offset].dtype)
+        if offset >= 0:
+            rows[:self.dimension - offset] = self.bands[offset]
+        else:
+            rows[-offset:] = self.bands[offset]
+        return rows
+
+    def step(self, state_vector):
+        """
+        Applies the operator. state_vector is a single state of shape (dimension,)
+        or a batch of states of shape (N, dimension).
+        """
+        psi = np.asarray(state_vector)
+        out = np.zeros(psi.shape, dtype=np.result_type(psi, self._dtype()))
+        d = self.dimension
+        for offset, values in self.bands.items():
+            if offset >= 0:
+                out[..., :d - offset] += values * psi[..., offset:]
+            else:
+                out[..., -offset:] += values * psi[..., :d + offset]
+        return out
+
+    def observe(self, quantum_state):
+        psi = quantum_state.state
+        return np.real(np.vdot(psi, self.step(psi)))
+
+    def observe_many(self, states):
+        states = np.asarray(states)
+        return np.einsum('ni,ni->n', states.conj(), self.step(states)).real
+
+    def dagger(self):
+        """Hermitian conjugate: each band moves to the mirrored offset."""
+        return BandedOperator(self.dimension,
+                              {-k: np.conj(v) for k, v in self.bands.items()},
+                              name=f"{self.name}_dagger")
+
+    def __add__(self, other):
+        bands = dict(self.bands)
+        for offset, values in other.bands.items():
+            bands[offset] = bands[offset] + values if offset in bands else values
+        return BandedOperator(self.dimension, bands, name=f"{self.name}+{other.name}")
+
+    def __mul__(self, scalar):
+        return BandedOperator(self.dimension, {k: scalar * v for k, v in self.bands.items()},
+                              name=f"{scalar}*{self.name}")
+
+    __rmul__ = __mul__
+
+    def __matmul__(self, other):
+        """
+        Operator product, band by band, in O(dimension) per band pair:
+        (A @ B)[r, r + p + q] = A[r, r + p] * B[r + p, r + p + q]
+        """
+        if not isinstance(other, BandedOperator):
+            return self.matrix @ other
+        d = self.dimension
+        product = {}
+        for p in self.bands:
+            a_rows = self._rows(p)
+            for q in other.bands:
+                offset = p + q
+                if abs(offset) >= d:
+                    continue
+                b_rows = np.zeros(d, dtype=other.bands[q].dtype)
+                shifted = other._rows(q)
+                if p >= 0:
+                    b_rows[:d - p] = shifted[p:]
+                else:
+                    b_rows[-p:] = shifted[:d + p]
+                rows = a_rows * b_rows
+                band = rows[:d - offset] if offset >= 0 else rows[-offset:]
+                product[offset] = product.get(offset, 0) + band
+        return BandedOperator(d, product, name=f"{self.name}*{other.name}")
+
+class LadderOperator(BandedOperator):
     """The 'Gain Control'. Moves energy up/down the rungs."""
     def __init__(self, dimension, kind='annihilation'):
-        matrix = np.zeros((dimension, dimension))
-        for n in range(1, dimension):
-            if kind == 'annihilation':
-                matrix[n-1, n] = np.sqrt(n)
-            else: # creation (a_dagger)
-                matrix[n, n-1] = np.sqrt(n)
-        
-        self.matrix = matrix
-        self.name = f"Ladder_{kind}"
+        # Only one off-diagonal is populated: sqrt(1), sqrt(2), ..., sqrt(dimension - 1)
+        rungs = np.sqrt(np.arange(1, dimension, dtype=float))
+        offset = 1 if kind == 'annihilation' else -1 # creation (a_dagger) sits below the diagonal
+        super().__init__(dimension, {offset: rungs}, name=f"Ladder_{kind}")
+        self.kind = kind
 
-    def step(self, state_vector):
-        return self.matrix @ state_vector
+def number_operator(dimension):
+    """N = a_dagger a: the rung counter, diagonal [0, 1, ..., dimension - 1]."""
+    return BandedOperator(dimension, {0: np.arange(dimension, dtype=float)}, name="Number")
+
+# Eigen-decompositions keyed by (omega, dimension, perturbation fingerprint), LRU-bounded
+_EIGEN_CACHE = OrderedDict()
+_EIGEN_CACHE_SIZE = 16
+_EIGEN_STATS = {"hits": 0, "misses": 0}
+
+def _operator_fingerprint(operator):
+    """Content hash of a perturbation (BandedOperator, QuantumOperator or plain matrix)."""
+    if operator is None:
+        return None
+    digest = hashlib.sha1()
+    if isinstance(operator, BandedOperator):
+        for offset in sorted(operator.bands):
+            digest.update(str(offset).encode())
+            digest.update(np.ascontiguousarray(operator.bands[offset]).tobytes())
+    else:
+        matrix = np.ascontiguousarray(getattr(operator, 'matrix', operator))
+        digest.update(str(matrix.shape).encode())
+        digest.update(matrix.tobytes())
+    return digest.hexdigest()
+
+def eigen_cache_info():
+    return dict(_EIGEN_STATS, size=len(_EIGEN_CACHE), maxsize=_EIGEN_CACHE_SIZE)
 
 class HarmonicOscillator:
     """
@@ -27,12 +151,64 @@ class HarmonicOscillator:
         self.m0 = mass_zero # Rest mass (The 'Cold Potato')
 
     def calculate_system_energy(self, n_level):
-        """E = (n + 1/2) * hbar * omega"""
+        """E = (n + 1/2) * hbar * omega (n_level may be an array of levels)"""
         hbar = 1.0 
-        return (n_level + 0.5) * hbar * self.omega
+        return (np.asarray(n_level) + 0.5) * hbar * self.omega
 
     def get_invariant_mass(self, n_level):
         """m = E / c^2"""
         c = 1.0 
         energy = self.calculate_system_energy(n_level)
-        return energy / (c**2)
\ No newline at end of file
+        return energy / (c**2)
+
+    def _eigensystem(self, dimension, perturbation=None):
+        """
+        (energies, eigenvectors) of H = hbar*omega*(a_dagger a + 1/2) + perturbation.
+        Unperturbed, the Fock basis already diagonalizes H, so eigenvectors is None.
+        """
+        key = (self.omega, dimension, _operator_fingerprint(perturbation))
+        if key in _EIGEN_CACHE:
+            _EIGEN_STATS["hits"] += 1
+            _EIGEN_CACHE.move_to_end(key)
+            return _EIGEN_CACHE[key]
+
+        _EIGEN_STATS["misses"] += 1
+        energies = self.calculate_system_energy(np.arange(dimension))
+        if perturbation is None:
+            eigensystem = (energies, None)
+        else:
+            # Perturbations must be Hermitian (eigh only reads one triangle).
+            hamiltonian = np.diag(energies) + np.asarray(getattr(perturbation, 'matrix', perturbation))
+            eigensystem = np.linalg.eigh(hamiltonian)
+
+        _EIGEN_CACHE[key] = eigensystem
+        if len(_EIGEN_CACHE) > _EIGEN_CACHE_SIZE:
+            _EIGEN_CACHE.popitem(last=False)
+        return eigensystem
+
+    def evolve(self, state, times, perturbation=None):
+        """
+        Schrodinger evolution |psi(t)> = exp(-i H t / hbar) |psi(0)> for every t in `times`.
+
+        state: Fock-space amplitudes, shape (dimension,) or a batch (N, dimension).
+        times: scalar or 1-D array of time points.
+        perturbation: Optional Hermitian term added to H (e.g. built from LadderOperator
+            products, a QuantumOperator or a plain matrix).
+
+        Returns an array of shape (len(times),) + state.shape. The diagonalization is
+        cached, so repeated evolutions only cost one vectorized phase multiply.
+        """
+        hbar = 1.0
+        psi = np.asarray(state, dtype=complex)
+        times = np.atleast_1d(np.asarray(times, dtype=float))
+        energies, vectors = self._eigensystem(psi.shape[-1], perturbation)
+
+        # (T, 1, ..., 1, dimension) so one phase row broadcasts over every state in the batch
+        phases = np.exp(-1j * np.outer(times, energies) / hbar)
+        phases = phases.reshape((len(times),) + (1,) * (psi.ndim - 1) + (len(energies),))
+
+        if vectors is None:
+            return phases * psi
+
+        coefficients = psi @ vectors.conj()
+        return (phases * coefficients) @ vectors.T
@@ -0,0 +1,257 @@
+"""
+Opt-in instrumentation for the core_physics engines.
+
+    from core_physics import instrumentation
+    instrumentation.enable()
+    ...
+    instrumentation.export(path="metrics.prom")
+
+enable() wraps the hot methods of AuditorLogic, UniversalClock and the neuro
+subsystems in place; disable() puts the original functions back, so nothing is
+measured (and nothing costs anything) while instrumentation is off. Return
+values pass through untouched.
+"""
+import os
+import time
+import bisect
+import inspect
+import threading
+import functools
+import numpy as np
+from core_physics.auditor_logic import AuditorLogic
+from core_physics.universal_clock import UniversalClock
+from core_physics.neuro_state import NeuroSubsystem, BlochNeuroSubsystem
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf.
+LATENCY_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+
+# Counters derived from a method's return value: method -> callable(result, metrics)
+def _count_status(result, metrics):
+    metrics.causal_status[result["causal_status"]] += 1
+
+def _count_purities(purities, metrics):
+    synchronized = int(np.count_nonzero(purities > 0.88))
+    metrics.causal_status["SYNCHRONIZED"] += synchronized
+    metrics.causal_status["DECOHERED"] += len(purities) - synchronized
+
+def _count_tick_flares(report, metrics):
+    metrics.solar_flares += sum(entry.startswith("SOLAR_CME") for entry in report["Interrupts"])
+
+def _count_batch_flares(report, metrics):
+    metrics.solar_flares += int(np.count_nonzero(report["Solar_Flares"]))
+
+def _count_summary_flares(report, metrics):
+    metrics.solar_flares += report["Interrupt_Summary"]["solar_flares"]
+
+def _count_pulse(result, metrics):
+    metrics.error_correction_pulses += 1
+
+def _count_batch_pulses(count, metrics):
+    metrics.error_correction_pulses += count
+
+INSTRUMENTED = {
+    AuditorLogic: {
+        "process_intent_state": _count_status,
+        # Every batched path (process_intents, intent_purities, process_stream,
+        # audit_document, audit_windows) pulses through _pulse_features; outcomes
+        # are counted there, from the purity array.
+        "_pulse_features": _count_purities,
+        "process_intents": None,
+        "intent_purities": None,
+        "audit_document": None,
+        "audit_windows": None,
+        "audit_environment": None,
+        "generate_stargate_receipt": None,
+    },
+    UniversalClock: {
+        "tick": _count_tick_flares,
+        "tick_many": _count_batch_flares,
+        "advance": _count_summary_flares,
+    },
+    NeuroSubsystem: {
+        "depolarize": None,
+        "get_purity": None,
+        "apply_error_correction": _count_pulse,
+    },
+    BlochNeuroSubsystem: {
+        "depolarize": None,
+        "get_purity": None,
+        "apply_error_correction": _count_pulse,
+    },
+}
+
+# Notification hooks: no timing, the counter receives the hook's single argument.
+HOOKS = {
+    AuditorLogic: {"_on_correction_pulses": _count_batch_pulses},
+}
+
+class _Metrics:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.errors = {}
+        self.buckets = {} # method -> per-bucket (non-cumulative) counts, +Inf last
+        self.latency_sum = {}
+        self.error_correction_pulses = 0
+        self.solar_flares = 0
+        self.causal_status = {"SYNCHRONIZED": 0, "DECOHERED": 0}
+
+    def record(self, method, elapsed, failed):
+        if method not in self.calls:
+            self.calls[method] = 0
+            self.errors[method] = 0
+            self.buckets[method] = [0] * (len(LATENCY_BUCKETS) + 1)
+            self.latency_sum[method] = 0.0
+        self.calls[method] += 1
+        self.errors[method] += failed
+        self.buckets[method][bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+        self.latency_sum[method] += elapsed
+
+_METRICS = _Metrics()
+_ORIGINALS = {}
+
+def _wrap(label, func, counter):
+    if inspect.isgeneratorfunction(func):
+        return _wrap_generator(label, func)
+
+    @functools.wraps(func)
+    def instrumented(*args, **kwargs):
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+        finally:
+            elapsed = time.perf_counter() - start
+            with _METRICS.lock:
+                _METRICS.record(label, elapsed, failed)
+                if counter is not None and not failed:
+                    counter(result, _METRICS)
+        return result
+    return instrumented
+
+def _wrap_generator(label, func):
+    """One call per generator, timed from the first request to exhaustion or close."""
+    @functools.wraps(func)
+    def instrumented(*args, **kwargs):
+        start = time.perf_counter()
+        failed = True
+        try:
+            yield from func(*args, **kwargs)
+            failed = False
+        except GeneratorExit:
+            failed = False
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with _METRICS.lock:
+                _METRICS.record(label, elapsed, failed)
+    return instrumented
+
+def _wrap_hook(func, counter):
+    @functools.wraps(func)
+    def hooked(self, value):
+        with _METRICS.lock:
+            counter(value, _METRICS)
+        return func(self, value)
+    return hooked
+
+def is_enabled():
+    return bool(_ORIGINALS)
+
+def enable():
+    """Starts recording. Calling it twice is harmless."""
+    if _ORIGINALS:
+        return
+    for cls, methods in INSTRUMENTED.items():
+        for name, counter in methods.items():
+            func = cls.__dict__[name]
+            _ORIGINALS[(cls, name)] = func
+            setattr(cls, name, _wrap(f"{cls.__name__}.{name}", func, counter))
+    for cls, hooks in HOOKS.items():
+        for name, counter in hooks.items():
+            func = cls.__dict__[name]
+            _ORIGINALS[(cls, name)] = func
+            setattr(cls, name, _wrap_hook(func, counter))
+
+def disable():
+    """Restores the original methods. Recorded metrics are kept until reset()."""
+    while _ORIGINALS:
+        (cls, name), func = _ORIGINALS.popitem()
+        setattr(cls, name, func)
+
+def reset():
+    global _METRICS
+    _METRICS = _Metrics()
+
+def snapshot():
+    """
+    Point-in-time copy of every metric. Latency buckets are cumulative
+    (Prometheus style): a list of (upper_bound, count) pairs ending at +Inf.
+    Error-correction pulses cover single pulses (apply_error_correction) and
+    the batched recurrence behind process_intents, streams and document and
+    windowed audits. A generator method (audit_windows) counts as one call,
+    timed until it is exhausted or closed.
+    """
+    metrics = _METRICS
+    bounds = LATENCY_BUCKETS + (float("inf"),)
+    with metrics.lock:
+        return {
+            "enabled": is_enabled(),
+            "calls": dict(metrics.calls),
+            "errors": dict(metrics.errors),
+            "latency": {
+                method: {
+                    "buckets": list(zip(bounds, np.cumsum(counts).tolist())),
+                    "sum": metrics.latency_sum[method],
+                    "count": metrics.calls[method],
+                }
+                for method, counts in metrics.buckets.items()
+            },
+            "error_correction_pulses": metrics.error_correction_pulses,
+            "solar_flares": metrics.solar_flares,
+            "causal_status": dict(metrics.causal_status),
+        }
+
+def to_prometheus(metrics=None, prefix="core_physics"):
+    """Renders a snapshot in the Prometheus text exposition format."""
+    metrics = snapshot() if metrics is None else metrics
+    lines = [
+        f"# TYPE {prefix}_calls_total counter",
+        *(f'{prefix}_calls_total{{method="{m}"}} {n}' for m, n in sorted(metrics["calls"].items())),
+        f"# TYPE {prefix}_errors_total counter",
+        *(f'{prefix}_errors_total{{method="{m}"}} {n}' for m, n in sorted(metrics["errors"].items())),
+        f"# TYPE {prefix}_latency_seconds histogram",
+    ]
+    for method, histogram in sorted(metrics["latency"].items()):
+        for bound, count in histogram["buckets"]:
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{prefix}_latency_seconds_bucket{{method="{method}",le="{le}"}} {count}')
+        lines.append(f'{prefix}_latency_seconds_sum{{method="{method}"}} {histogram["sum"]!r}')
+        lines.append(f'{prefix}_latency_seconds_count{{method="{method}"}} {histogram["count"]}')
+    lines += [
+        f"# TYPE {prefix}_error_correction_pulses_total counter",
+        f"{prefix}_error_correction_pulses_total {metrics['error_correction_pulses']}",
+        f"# TYPE {prefix}_solar_flares_total counter",
+        f"{prefix}_solar_flares_total {metrics['solar_flares']}",
+        f"# TYPE {prefix}_causal_status_total counter",
+        *(f'{prefix}_causal_status_total{{status="{s}"}} {n}' for s, n in sorted(metrics["causal_status"].items())),
+    ]
+    return "\n".join(lines) + "\n"
+
+def export(path=None, callback=None):
+    """
+    Takes one snapshot and hands it out.
+    path: Written atomically in the Prometheus text format (for a node-exporter textfile collector).
+    callback: Called with the snapshot dict.
+    Returns the snapshot.
+    """
+    metrics = snapshot()
+    if path is not None:
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as handle:
+            handle.write(to_prometheus(metrics))
+        os.replace(temporary, path)
+    if callback is not None:
+        callback(metrics)
+    return metrics
@@ -0,0 +1,125 @@
+"""
+Chunked ingestion of large intent documents.
+
+Sources are consumed one chunk at a time, so memory is bounded by the chunk size
+(plus one window), never by the document:
+- a file path (str or os.PathLike), read in binary chunks;
+- a bytes-like object (bytes, bytearray, memoryview, mmap), sliced without copying;
+- an iterable of chunks, each bytes-like or str (wrap in-memory text as [text]).
+Bytes are decoded incrementally (multi-byte characters may straddle chunks) and
+every chunk becomes a NumPy array of code points.
+"""
+import os
+import codecs
+import numpy as np
+
+UNICODE_SIZE = 0x110000
+
+def _byte_chunks(source, chunk_size):
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as handle:
+            while True:
+                chunk = handle.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        return
+    try:
+        view = memoryview(source).cast("B")
+    except TypeError:
+        # Not a buffer: an iterable of bytes-like or str chunks.
+        yield from source
+        return
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size]
+
+def iter_code_points(source, chunk_size=1 << 20, encoding="utf-8", errors="replace"):
+    """Yields one 1-D array of code points per chunk (uint8 for pure-ASCII chunks, else uint32)."""
+    decoder = codecs.getincrementaldecoder(encoding)(errors)
+    ascii_compatible = codecs.lookup(encoding).name == "utf-8"
+    for chunk in _byte_chunks(source, chunk_size):
+        if isinstance(chunk, str):
+            text = chunk
+        else:
+            raw = np.frombuffer(chunk, dtype=np.uint8)
+            if ascii_compatible and not decoder.getstate()[0] and (raw.size == 0 or raw.max() < 0x80):
+                # Pure ASCII: the bytes already are the code points.
+                yield raw
+                continue
+            text = decoder.decode(chunk)
+        if text:
+            yield np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield np.frombuffer(tail.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+
+def document_features(source, chunk_size=1 << 20, encoding="utf-8", errors="replace"):
+    """
+    (unique_chars, total_chars, ordinal_sum) of a whole document, accumulated chunk
+    by chunk: the same numbers as len(set(text)), len(text) and sum(map(ord, text)).
+    Distinct characters are tracked in a fixed 1.1 MB table of every code point.
+    """
+    seen = np.zeros(UNICODE_SIZE, dtype=bool)
+    total_chars = ordinal_sum = 0
+    for codes in iter_code_points(source, chunk_size, encoding, errors):
+        seen[codes] = True
+        total_chars += len(codes)
+        ordinal_sum += int(codes.sum(dtype=np.int64))
+    return int(np.count_nonzero(seen)), total_chars, ordinal_sum
+
+def _window_features(codes, prefix, starts, window):
+    """
+    (unique, total, ordinal_sum) arrays for windows [start, start + window) of `codes`.
+    prefix: Running ordinal sums of codes, with a leading 0.
+    """
+    stops = np.minimum(starts + window, len(codes))
+    ordinal_sum = prefix[stops] - prefix[starts]
+    total_chars = stops - starts
+
+    # Distinct code points per window: sort each row, count value changes (padding excluded)
+    offsets = np.arange(window)
+    index = starts[:, None] + offsets
+    valid = offsets < total_chars[:, None]
+    rows = np.where(valid, codes[np.minimum(index, len(codes) - 1)], UNICODE_SIZE)
+    ordered = np.sort(rows, axis=1)
+    changes = np.ones(ordered.shape, dtype=bool)
+    changes[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    unique_chars = np.count_nonzero(changes & (ordered != UNICODE_SIZE), axis=1)
+    return unique_chars, total_chars, ordinal_sum
+
+def iter_window_features(source, window, step=None, chunk_size=1 << 20, encoding="utf-8", errors="replace"):
+    """
+    Sliding-window features over a document: windows of `window` characters
+    starting every `step` characters (default: non-overlapping). If the full
+    windows leave a tail uncovered, one final shorter window covers it.
+
+    Yields (unique_chars, total_chars, ordinal_sum) arrays, one batch of windows
+    per chunk; only the characters of unfinished windows are carried over.
+    """
+    step = window if step is None else step
+    if window < 1 or step < 1:
+        raise ValueError("window and step must be positive.")
+
+    carry = np.zeros(0, dtype=np.uint32)
+    consumed = 0 # document offset of carry[0]
+    next_start = 0 # document offset of the next window
+    max_windows = max(1, chunk_size // window) # bounds each batch's (windows, window) matrix
+    for codes in iter_code_points(source, chunk_size, encoding, errors):
+        carry = np.concatenate((carry, codes.astype(np.uint32, copy=False)))
+        prefix = np.concatenate(([0], np.cumsum(carry, dtype=np.int64)))
+        end = consumed + len(carry)
+        while next_start + window <= end:
+            count = min(max_windows, (end - window - next_start) // step + 1)
+            starts = next_start - consumed + step * np.arange(count)
+            yield _window_features(carry, prefix, starts, window)
+            next_start += count * step
+        # Keep only the characters that unfinished windows still need.
+        drop = min(next_start - consumed, len(carry))
+        carry = carry[drop:]
+        consumed += drop
+
+    end = consumed + len(carry)
+    covered = next_start - step + window if next_start else 0
+    if next_start < end and covered < end:
+        prefix = np.concatenate(([0], np.cumsum(carry, dtype=np.int64)))
+        yield _window_features(carry, prefix, np.array([next_start - consumed]), window)
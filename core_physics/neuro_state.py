@@ -7,6 +7,11 @@ class NeuroSubsystem:
     def __init__(self, state_vector):
         self.rho = np.outer(state_vector, np.conj(state_vector))
         
+    def depolarize(self, noise_level):
+        """Environmental decoherence: mixes rho toward the maximally mixed state I/d."""
+        dimension = self.rho.shape[0]
+        self.rho = (1 - noise_level) * self.rho + noise_level * np.eye(dimension) / dimension
+
     def get_purity(self):
         purity = np.real(np.trace(self.rho @ self.rho))
         return purity
@@ -22,4 +27,138 @@ class NeuroSubsystem:
         gain = 0.5 if current_purity < 0.85 else 0.2
         
         self.rho = (1 - gain) * self.rho + gain * reference_signal
-        return self.get_purity()
\ No newline at end of file
+        return self.get_purity()
+
+class BlochNeuroSubsystem:
+    """
+    Compact single-qubit Prefrontal Cortex.
+    Stores only the Bloch vector r = (x, y, z), with rho = (I + xX + yY + zZ) / 2,
+    so purity, noise and correction are a handful of scalar updates.
+    """
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, state_vector):
+        alpha, beta = complex(state_vector[0]), complex(state_vector[1])
+        norm = abs(alpha) ** 2 + abs(beta) ** 2
+        coherence = alpha.conjugate() * beta / norm
+        self.x = 2 * coherence.real
+        self.y = 2 * coherence.imag
+        self.z = (abs(alpha) ** 2 - abs(beta) ** 2) / norm
+
+    @staticmethod
+    def bloch_from_rho(rho):
+        """(x, y, z) of a 2x2 density matrix."""
+        coherence = complex(rho[1][0])
+        return (2 * coherence.real, 2 * coherence.imag, float(np.real(rho[0][0] - rho[1][1])))
+
+    @classmethod
+    def from_rho(cls, rho):
+        subsystem = cls.__new__(cls)
+        subsystem.x, subsystem.y, subsystem.z = cls.bloch_from_rho(rho)
+        return subsystem
+
+    @property
+    def bloch_vector(self):
+        return (self.x, self.y, self.z)
+
+    @property
+    def rho(self):
+        """Full density matrix, built on demand."""
+        return 0.5 * np.array([[1 + self.z, self.x - 1j * self.y],
+                               [self.x + 1j * self.y, 1 - self.z]])
+
+    @rho.setter
+    def rho(self, matrix):
+        self.x, self.y, self.z = self.bloch_from_rho(matrix)
+
+    def depolarize(self, noise_level):
+        """Mixing toward I/2 just shrinks the Bloch vector."""
+        keep = 1 - noise_level
+        self.x *= keep
+        self.y *= keep
+        self.z *= keep
+
+    def get_purity(self):
+        """Tr(rho^2) = (1 + |r|^2) / 2"""
+        return (1 + self.x * self.x + self.y * self.y + self.z * self.z) / 2
+
+    def apply_error_correction(self, reference_signal):
+        """
+        Tesla Frequency Bypass on the Bloch sphere.
+        reference_signal: a Bloch vector (x, y, z) or a 2x2 density matrix.
+        Same 0.5 / 0.2 gain rule as NeuroSubsystem.
+        """
+        if not isinstance(reference_signal, tuple):
+            reference_signal = self.bloch_from_rho(reference_signal)
+        ref_x, ref_y, ref_z = reference_signal
+
+        gain = 0.5 if self.get_purity() < 0.85 else 0.2
+        keep = 1 - gain
+        self.x = keep * self.x + gain * ref_x
+        self.y = keep * self.y + gain * ref_y
+        self.z = keep * self.z + gain * ref_z
+        return self.get_purity()
+
+class NeuroEnsemble:
+    """
+    Many Prefrontal Cortices at once: one contiguous (N, d, d) density-matrix array.
+    Noise, correction and purity are applied to every member in a single call.
+    """
+    def __init__(self, state_vectors, dtype=np.complex128):
+        """
+        :param state_vectors: (N, d) array, one pure state per member.
+        :param dtype: complex128, or complex64 to halve memory for huge ensembles.
+        """
+        states = np.asarray(state_vectors, dtype=dtype)
+        self.rho = np.einsum('ni,nj->nij', states, states.conj())
+
+    @classmethod
+    def replicate(cls, state_vector, n_members, dtype=np.complex128):
+        """N identical members prepared in the same pure state."""
+        ensemble = cls.__new__(cls)
+        single = np.outer(state_vector, np.conj(state_vector)).astype(dtype)
+        ensemble.rho = np.empty((n_members,) + single.shape, dtype=dtype)
+        ensemble.rho[...] = single
+        return ensemble
+
+    def __len__(self):
+        return self.rho.shape[0]
+
+    @property
+    def dimension(self):
+        return self.rho.shape[1]
+
+    def _per_member(self, values):
+        """Scalar or (N,) parameter -> (N,) array."""
+        return np.broadcast_to(np.asarray(values, dtype=float), (len(self),))
+
+    def depolarize(self, noise_levels):
+        """In-place mixing toward I/d; noise_levels is a scalar or one level per member."""
+        noise = self._per_member(noise_levels)
+        d = self.dimension
+        self.rho *= (1 - noise)[:, None, None]
+        # Index the diagonal directly: a reshape would silently copy a non-contiguous rho
+        diagonal = np.arange(d)
+        self.rho[:, diagonal, diagonal] += (noise / d)[:, None]
+
+    def get_purity(self):
+        """Tr(rho^2) for every member in one einsum."""
+        return np.einsum('nij,nji->n', self.rho, self.rho).real
+
+    def realign(self, reference_signal, gains):
+        """rho <- (1 - g) rho + g * reference, with one gain per member."""
+        gains = self._per_member(gains)
+        reference = np.asarray(reference_signal)
+        self.rho *= (1 - gains)[:, None, None]
+        # Only the reference's non-zero entries need touching: O(N) temporaries, never O(N d^2).
+        for i, j in zip(*np.nonzero(reference)):
+            self.rho[:, i, j] += gains * reference[i, j]
+
+    def apply_error_correction(self, reference_signal):
+        """
+        Tesla Frequency Bypass for the whole ensemble.
+        Each member gets the same adaptive gain as NeuroSubsystem: 0.5 below 0.85 purity, else 0.2.
+        """
+        gains = np.where(self.get_purity() < 0.85, 0.5, 0.2)
+        self.realign(reference_signal, gains)
+        return self.get_purity()
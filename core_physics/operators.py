@@ -1,15 +1,43 @@
+import weakref
 import numpy as np
 
+# Hermiticity verdicts keyed by matrix identity. Only read-only arrays that own
+# their data are cached (their content cannot change), so reusing one frozen
+# matrix across operators validates it once; anything else is checked every time.
+_HERMITIAN_VERDICTS = {}
+
+def _is_hermitian(matrix):
+    if matrix.flags.writeable or not matrix.flags.owndata:
+        return bool(np.allclose(matrix, matrix.conj().T))
+
+    key = id(matrix)
+    cached = _HERMITIAN_VERDICTS.get(key)
+    if cached is not None and cached[0]() is matrix:
+        return cached[1]
+
+    verdict = bool(np.allclose(matrix, matrix.conj().T))
+    # The entry dies with the array, before its id can be reused.
+    forget = lambda _, key=key: _HERMITIAN_VERDICTS.pop(key, None)
+    _HERMITIAN_VERDICTS[key] = (weakref.ref(matrix, forget), verdict)
+    return verdict
+
 class QuantumOperator:
     """
     Finalized Operator Class. 
     Acts as the 'Receiver' to extract observables from the state array.
     """
-    def __init__(self, matrix, name):
-        self.matrix = np.array(matrix)
+    def __init__(self, matrix, name, trusted=False):
+        """
+        matrix: Copied, unless it is a read-only ndarray: that one is shared and its
+        Hermitian check runs once (freeze a big matrix with setflags(write=False)
+        to build many operators from it cheaply).
+        trusted: Skip the Hermitian check (for preset, known-good instruments).
+        """
+        frozen = isinstance(matrix, np.ndarray) and not matrix.flags.writeable
+        self.matrix = matrix if frozen else np.array(matrix)
         self.name = name
         # HERMITIAN CHECK: Ensures signal integrity and real-world measurability.
-        if not np.allclose(self.matrix, self.matrix.conj().T):
+        if not trusted and not _is_hermitian(self.matrix):
             raise ValueError(f"CRITICAL: {name} is non-Hermitian. Signal scrambled.")
 
     def observe(self, quantum_state):
@@ -17,6 +45,22 @@ class QuantumOperator:
         psi = quantum_state.state
         return np.real(np.vdot(psi, self.matrix @ psi))
 
+    def observe_many(self, states):
+        """Expectation values for a stacked (N, d) array of states, in one pass."""
+        states = np.asarray(states)
+        return np.einsum('ni,ni->n', states.conj(), states @ self.matrix.T).real
+
+def observe_table(operators, states):
+    """
+    (N, K) table of expectation values: N stacked states against K operators.
+    Dense operators share one einsum; banded (Fock-space) operators are applied column by column.
+    """
+    states = np.asarray(states)
+    if all(getattr(op, 'bands', None) is None for op in operators):
+        matrices = np.stack([op.matrix for op in operators])
+        return np.einsum('ni,kij,nj->nk', states.conj(), matrices, states, optimize=True).real
+    return np.stack([op.observe_many(states) for op in operators], axis=1)
+
 # PRE-SET INSTRUMENTATION
 # Sigma_Z: Measuring the basic binary state (Matter/Ground)
-sigma_z = QuantumOperator([[1, 0], [0, -1]], name="Z-Observable")
\ No newline at end of file
+sigma_z = QuantumOperator([[1, 0], [0, -1]], name="Z-Observable", trusted=True)
@@ -0,0 +1,74 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import numpy as np
+
+def _evaluate_chunk(model, names, coords, vectorized):
+    """
+    Evaluates one chunk of grid points.
+    coords: one 1-D array per axis, holding that axis' value at every point of the chunk.
+    """
+    if vectorized:
+        return np.asarray(model(**dict(zip(names, coords))))
+    return np.array([model(**dict(zip(names, point))) for point in zip(*coords)])
+
+def _chunk_coords(axis_values, shape, start, stop):
+    """Axis values for flat grid indices [start, stop) in C order."""
+    index = np.unravel_index(np.arange(start, stop), shape)
+    return [values[i] for values, i in zip(axis_values, index)]
+
+def run_sweep(model, axes, vectorized=False, chunk_size=1 << 16, workers=None,
+              out_path=None, dtype=float):
+    """
+    Evaluates `model` over the full grid spanned by `axes`.
+
+    model: Callable taking one keyword argument per axis name. With
+        vectorized=True it receives 1-D arrays (one entry per grid point of the
+        chunk) and must return an array of the same length; otherwise it is
+        called once per point with scalars.
+    axes: Ordered mapping of axis name -> 1-D array of values.
+    chunk_size: Grid points per chunk. Bounds the working memory per worker.
+    workers: Process count. None = all cores; 1 = evaluate in this process.
+        Models run in a pool must be picklable (module-level functions).
+    out_path: If given, results stream into a memory-mapped .npy file as chunks
+        finish and the axes are saved next to it as '<name>.axes.npz'.
+
+    Returns an array of shape (len(axis_0), len(axis_1), ...), a np.memmap when out_path is set.
+    """
+    names = list(axes)
+    axis_values = [np.asarray(axes[name]) for name in names]
+    shape = tuple(len(values) for values in axis_values)
+    total = int(np.prod(shape))
+
+    if out_path is not None:
+        out = np.lib.format.open_memmap(out_path, mode='w+', dtype=dtype, shape=shape)
+        np.savez(os.path.splitext(out_path)[0] + '.axes.npz', **dict(zip(names, axis_values)))
+    else:
+        out = np.empty(shape, dtype=dtype)
+    flat = out.reshape(-1)
+
+    bounds = [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+    workers = os.cpu_count() if workers is None else workers
+
+    if workers <= 1 or len(bounds) <= 1:
+        for start, stop in bounds:
+            coords = _chunk_coords(axis_values, shape, start, stop)
+            flat[start:stop] = _evaluate_chunk(model, names, coords, vectorized)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Backpressure: never more than two chunks in flight per worker.
+            pending = {}
+            for start, stop in bounds:
+                coords = _chunk_coords(axis_values, shape, start, stop)
+                pending[pool.submit(_evaluate_chunk, model, names, coords, vectorized)] = (start, stop)
+                if len(pending) >= 2 * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        lo, hi = pending.pop(future)
+                        flat[lo:hi] = future.result()
+            for future in wait(pending).done:
+                lo, hi = pending[future]
+                flat[lo:hi] = future.result()
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
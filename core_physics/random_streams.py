@@ -0,0 +1,33 @@
+import numpy as np
+
+# Every stochastic engine takes `seed`: None (fresh OS entropy), an int, a
+# SeedSequence or a ready numpy Generator (used as-is, so components can share one stream).
+
+def seed_sequence(seed=None):
+    """The SeedSequence behind `seed` (a Generator yields the one it was seeded from)."""
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return seed.bit_generator.seed_seq
+    return np.random.SeedSequence(seed)
+
+def make_rng(seed=None):
+    """A numpy Generator for `seed`; Generators pass through unchanged."""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed_sequence(seed))
+
+def spawn(seed, n_streams):
+    """
+    n independent child Generators for fan-out to workers (SeedSequence.spawn).
+    Spawning again from the same Generator or SeedSequence yields new, distinct children.
+    """
+    return [np.random.default_rng(child) for child in seed_sequence(seed).spawn(n_streams)]
+
+def spawn_seeds(seed, n_streams):
+    """Like spawn(), but one 32-bit integer per child (for seed_simulator and other int-only APIs)."""
+    return [int(child.generate_state(1)[0]) for child in seed_sequence(seed).spawn(n_streams)]
+
+def draw_seed(rng):
+    """A 32-bit integer seed drawn from a Generator's own stream."""
+    return int(rng.integers(2 ** 32))
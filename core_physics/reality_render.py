@@ -1,34 +1,97 @@
 import numpy as np
-from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
+from core_physics.circuit_registry import registry, get_simulator
+from core_physics.wave_mechanics import StateVector
+from core_physics.random_streams import make_rng, draw_seed
+
+BACKENDS = ("aer", "numpy", "statevector")
 
 class RealityRenderer:
     """
     Simulates the 'rendering' of reality from quantum superposition.
     This aligns with the 'Observer Effect' where consciousness/measurement
     collapses possibilities into a single outcome.
+
+    backend:
+    - "aer": Every render is a real circuit submitted to AerSimulator.
+    - "numpy": Closed-form Born rule. P(1) = sin^2(theta / 2) for RY(theta)|0>,
+      sampled in one vectorized draw (no circuit, no job overhead).
+    - "statevector": The RY circuit run in-process on a StateVector.
+
+    seed: Seed (int, SeedSequence or numpy Generator). Every backend draws from
+    it; Aer jobs get their seed_simulator from the same stream.
     """
-    def __init__(self):
-        self.sim = AerSimulator()
+    def __init__(self, backend="aer", seed=None):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown render backend '{backend}'. Choose from {BACKENDS}.")
+        self.backend = backend
+        self.rng = make_rng(seed)
+
+    @property
+    def sim(self):
+        """Shared AerSimulator, only created when an Aer render actually happens."""
+        return get_simulator()
+
+    @staticmethod
+    def manifestation_probability(intention_strength):
+        """
+        P('1') after RY(intention_strength * pi)|0>.
+        Accepts a scalar or an array of strengths.
+        """
+        theta = np.asarray(intention_strength, dtype=float) * np.pi
+        return np.sin(theta / 2) ** 2
 
     def manifest_object(self, intention_strength=0.5):
         """
         intention_strength (0 to 1): Adjusts the probability of a successful render.
         Math: We rotate the qubit state based on 'intention' before measurement.
         """
-        qc = QuantumCircuit(1, 1)
-        
+        if self.backend != "aer":
+            outcome = self.manifest_batch([intention_strength], shots=1)[0]
+            return "Object Manifested" if outcome == 1 else "Stayed in Potential"
+
         # Map intention_strength to a rotation angle (0 to PI)
         theta = intention_strength * np.pi
-        qc.ry(theta, 0) 
-        
-        qc.measure(0, 0)
-        
-        result = self.sim.run(qc, shots=1).result()
+        qc = registry.bind("ry_render", self.sim, theta=theta)
+
+        result = self.sim.run(qc, shots=1, seed_simulator=draw_seed(self.rng)).result()
         outcome = list(result.get_counts().keys())[0]
-        
+
         return "Object Manifested" if outcome == '1' else "Stayed in Potential"
 
+    def manifest_batch(self, intention_strengths, shots=1):
+        """
+        Renders a whole array of intentions at once.
+
+        Returns an int array (same shape as intention_strengths) holding the
+        number of 'Object Manifested' outcomes out of `shots` for each strength.
+        With shots=1 this is simply the array of 0/1 outcomes.
+        """
+        strengths = np.asarray(intention_strengths, dtype=float)
+
+        if self.backend == "numpy":
+            # One binomial draw per strength covers every shot in a single call.
+            return self.rng.binomial(shots, self.manifestation_probability(strengths))
+
+        if self.backend == "statevector":
+            manifested = []
+            for strength in strengths.ravel():
+                counts = StateVector(1).ry(strength * np.pi, 0).sample_counts(shots, self.rng)
+                manifested.append(counts.get('1', 0))
+            return np.array(manifested, dtype=np.int64).reshape(strengths.shape)
+
+        if strengths.size == 0:
+            # Aer rejects a job with no parameter binds; there is nothing to render.
+            return np.zeros(strengths.shape, dtype=np.int64)
+
+        # One job for the whole batch: the compiled template is re-bound per strength.
+        thetas = strengths.ravel() * np.pi
+        qc = registry.compiled("ry_render", self.sim)
+        binds = registry.parameter_binds("ry_render", self.sim, theta=thetas)
+        result = self.sim.run(qc, parameter_binds=binds, shots=shots,
+                              seed_simulator=draw_seed(self.rng)).result()
+        manifested = [result.get_counts(i).get('1', 0) for i in range(len(thetas))]
+        return np.array(manifested, dtype=np.int64).reshape(strengths.shape)
+
 if __name__ == "__main__":
     renderer = RealityRenderer()
-    print(f"Manifestation Result: {renderer.manifest_object(0.8)}")
\ No newline at end of file
+    print(f"Manifestation Result: {renderer.manifest_object(0.8)}")
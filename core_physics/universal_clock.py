@@ -1,13 +1,15 @@
 import time
-import random
 import math
+import numpy as np
+from core_physics.random_streams import make_rng
 
 class UniversalClock:
-    def __init__(self, observer_mass_kg=70, vacuum_index=0):
+    def __init__(self, observer_mass_kg=70, vacuum_index=0, seed=None):
         """
         Initializes the Universal Clock.
         :param observer_mass_kg: The 'Presence' (Mass/Energy) of the observer.
         :param vacuum_index: 0 = Earth Standard. Negative = Anti-Gravity (Dirac Sea).
+        :param seed: Seed (int, SeedSequence or numpy Generator) for the clock's random stream.
         """
         # Physics Constants
         self.PLANCK_TIME = 5.39e-44 
@@ -23,6 +25,7 @@ class UniversalClock:
         # Cosmic State (Simulated)
         self.solar_flare_active = False
         self.nearby_supernova_dist = 640 # light years (Betelgeuse)
+        self.rng = make_rng(seed)
 
     def calculate_dilation(self):
         """Calculates Time Dilation based on Gravity/Vacuum Pressure."""
@@ -48,7 +51,7 @@ class UniversalClock:
         """Checks for external variables (The Sun, Supernovas)."""
         interrupts = []
         
-        if random.random() < 0.05: # 5% chance of flare
+        if self.rng.random() < 0.05: # 5% chance of flare
             self.solar_flare_active = True
             interrupts.append("SOLAR_CME_DETECTED: Resonance Shift +3.5Hz")
             
@@ -72,7 +75,7 @@ class UniversalClock:
         dilation = self.calculate_dilation()
         experienced_time = duration_sec * dilation
         
-        self.entropy_state += (random.uniform(0.001, 0.005) * self.observer_mass)
+        self.entropy_state += (self.rng.uniform(0.001, 0.005) * self.observer_mass)
         self.total_planck_ticks += (experienced_time / self.PLANCK_TIME)
         
         return {
@@ -82,6 +85,145 @@ class UniversalClock:
             "Interrupts": self.check_cosmic_interrupts()
         }
 
+    def tick_many(self, n_ticks, duration_sec=1):
+        """
+        Runs n_ticks ticks without building interrupt strings.
+        Consumes the random stream in exactly the same order as n calls to tick()
+        (one (entropy, flare) pair of draws per tick, in a single vectorized draw),
+        and reports the per-tick flares as an array.
+        """
+        dilation = self.calculate_dilation()
+        experienced_time = duration_sec * dilation
+        planck_step = experienced_time / self.PLANCK_TIME
+        draws = self.rng.random((n_ticks, 2))
+        low, span = 0.001, 0.005 - 0.001 # rng.uniform(0.001, 0.005), unrolled
+
+        # Running sums via cumsum accumulate left to right, bit-for-bit like the tick loop.
+        entropy = np.concatenate(([self.entropy_state], (low + span * draws[:, 0]) * self.observer_mass))
+        planck_ticks = np.concatenate(([self.total_planck_ticks], np.full(n_ticks, planck_step)))
+        self.entropy_state = entropy.cumsum()[-1].item()
+        self.total_planck_ticks = planck_ticks.cumsum()[-1].item()
+        flares = draws[:, 1] < 0.05
+
+        if flares.any():
+            self.solar_flare_active = True
+
+        return {
+            "Market_Time": duration_sec,
+            "Universal_Time": experienced_time,
+            "Dilation_Factor": dilation,
+            "Solar_Flares": flares,
+            # Every tick reports exactly one supernova interrupt, plus any flare.
+            "Interrupt_Count": flares.astype(int) + 1
+        }
+
+    def advance(self, n_ticks, duration_sec=1):
+        """
+        Fast-forwards the clock by n_ticks calls of tick(duration_sec) in O(1).
+
+        - Planck ticks: dilation is constant over the run, so they add up analytically.
+        - Entropy: one draw from the distribution of the sum of n uniforms
+          (Irwin-Hall; exact for short runs, its normal limit for long ones).
+        - Solar flares: one binomial draw for the number of 5% flare rolls that hit.
+        Instead of n interrupt lists, a compact summary is returned.
+        """
+        n_ticks = int(n_ticks)
+        dilation = self.calculate_dilation()
+        experienced_time = n_ticks * duration_sec * dilation
+
+        # Sum of n U(0.001, 0.005) = 0.001 * n + 0.004 * IrwinHall(n)
+        if n_ticks <= 32:
+            irwin_hall = self.rng.random(n_ticks).sum()
+        else:
+            irwin_hall = np.clip(self.rng.normal(n_ticks / 2, math.sqrt(n_ticks / 12)), 0, n_ticks)
+        self.entropy_state += (0.001 * n_ticks + 0.004 * irwin_hall) * self.observer_mass
+        self.total_planck_ticks += (experienced_time / self.PLANCK_TIME)
+
+        flares = int(self.rng.binomial(n_ticks, 0.05)) if n_ticks > 0 else 0
+        if flares:
+            self.solar_flare_active = True
+
+        causality = self.check_causality(self.nearby_supernova_dist, 640)
+
+        return {
+            "Market_Time": n_ticks * duration_sec,
+            "Universal_Time": experienced_time,
+            "Dilation_Factor": dilation,
+            "Ticks": n_ticks,
+            "Interrupt_Summary": {
+                "solar_flares": flares,
+                "supernova": causality["status"],
+                "supernova_lag_years": causality["lag_years"],
+                # Every tick reports exactly one supernova interrupt, plus any flare.
+                "total": n_ticks + flares
+            }
+        }
+
+class ClockEnsemble:
+    """
+    A population of Universal Clocks held as NumPy arrays.
+    One tick advances every observer at once (dilation, entropy and flare draws
+    are vectorized); each member follows the same laws as an independent UniversalClock.
+    """
+    def __init__(self, observer_mass_kg, vacuum_index=0, seed=None):
+        """
+        :param observer_mass_kg: Array (any shape) of observer masses.
+        :param vacuum_index: Scalar or array broadcastable against the masses.
+        :param seed: Seed (int, SeedSequence or numpy Generator) for the ensemble's random stream.
+        """
+        self.PLANCK_TIME = 5.39e-44
+        self.SPEED_OF_LIGHT = 299792458 # m/s
+        self.GRAVITATIONAL_CONSTANT = 6.674e-11
+
+        mass, vacuum = np.broadcast_arrays(np.asarray(observer_mass_kg, dtype=float),
+                                           np.asarray(vacuum_index, dtype=float))
+        self.observer_mass = mass.copy()
+        self.vacuum_index = vacuum.copy()
+        self.entropy_state = np.zeros(mass.shape)
+        self.total_planck_ticks = np.zeros(mass.shape)
+
+        self.solar_flare_active = np.zeros(mass.shape, dtype=bool)
+        self.nearby_supernova_dist = 640 # light years (Betelgeuse)
+        self.rng = make_rng(seed)
+
+    # The light cone is the same box for every observer.
+    check_causality = UniversalClock.check_causality
+
+    def __len__(self):
+        return self.observer_mass.size
+
+    @property
+    def shape(self):
+        return self.observer_mass.shape
+
+    def calculate_dilation(self):
+        """Vectorized UniversalClock.calculate_dilation for every observer."""
+        gravity_load = self.observer_mass * (1 + np.abs(self.vacuum_index))
+        return np.where(self.vacuum_index < 0,
+                        1 + (gravity_load / 1000),
+                        1 - (gravity_load / 100000))
+
+    def tick(self, duration_sec=1):
+        dilation = self.calculate_dilation()
+        experienced_time = duration_sec * dilation
+
+        self.entropy_state += self.rng.uniform(0.001, 0.005, self.shape) * self.observer_mass
+        self.total_planck_ticks += experienced_time / self.PLANCK_TIME
+
+        flares = self.rng.random(self.shape) < 0.05 # 5% chance of flare, per observer
+        self.solar_flare_active |= flares
+        causality = self.check_causality(self.nearby_supernova_dist, 640)
+
+        return {
+            "Market_Time": duration_sec,
+            "Universal_Time": experienced_time,
+            "Dilation_Factor": dilation,
+            "Solar_Flares": flares,
+            # Every observer always receives exactly one supernova interrupt.
+            "Interrupt_Count": flares.astype(int) + 1,
+            "Supernova": causality
+        }
+
 if __name__ == "__main__":
     clock = UniversalClock(observer_mass_kg=80, vacuum_index=0)
     print("--- SYSTEM START ---")
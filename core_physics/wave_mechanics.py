@@ -20,6 +20,115 @@ class QuantumState:
     def __repr__(self):
         return f"State: {self.state[0]:.3f}|0> + {self.state[1]:.3f}|1>"
 
+def _mix(amp0, amp1, gate, block):
+    """
+    In-place 2x2 gate on paired amplitude views (target bit 0 / target bit 1).
+    Large views are walked in blocks so temporaries never exceed `block` amplitudes.
+    """
+    if amp0.ndim > 0 and amp0.size > block:
+        chunk = max(1, amp0.shape[0] * block // amp0.size)
+        for i in range(0, amp0.shape[0], chunk):
+            if chunk == 1:
+                _mix(amp0[i], amp1[i], gate, block)
+            else:
+                _mix(amp0[i:i + chunk], amp1[i:i + chunk], gate, block)
+        return
+
+    (g00, g01), (g10, g11) = gate
+    if g01 == 0 and g10 == 0:
+        amp0 *= g00
+        amp1 *= g11
+    elif g00 == 0 and g11 == 0 and g01 == 1 and g10 == 1:
+        swapped = amp0.copy()
+        amp0[...] = amp1
+        amp1[...] = swapped
+    else:
+        upper = g00 * amp0 + g01 * amp1
+        amp1 *= g11
+        amp1 += g10 * amp0
+        amp0[...] = upper
+
+class StateVector(QuantumState):
+    """
+    An n-qubit register: the QuantumState generalized to 2^n amplitudes.
+    Gates act in place on reshaped views of the one 2^n buffer.
+
+    Bit order follows Qiskit: qubit 0 is the least significant bit, so
+    sampled bitstrings line up with Aer counts (e.g. '10' means q1=1, q0=0).
+    """
+    BLOCK = 1 << 16 # max amplitudes touched per gate chunk
+
+    def __init__(self, num_qubits, dtype=np.complex128):
+        self.num_qubits = num_qubits
+        self.state = np.zeros(2 ** num_qubits, dtype=dtype)
+        self.state[0] = 1 # |00...0>
+
+    def apply_gate(self, gate, qubit):
+        """Any 2x2 unitary on one qubit."""
+        view = self.state.reshape(2 ** (self.num_qubits - 1 - qubit), 2, 2 ** qubit)
+        _mix(view[:, 0, :], view[:, 1, :], np.asarray(gate).tolist(), self.BLOCK)
+        return self
+
+    def apply_controlled(self, gate, control, target):
+        """2x2 unitary on `target`, applied only where `control` is |1>."""
+        high, low = max(control, target), min(control, target)
+        view = self.state.reshape(2 ** (self.num_qubits - 1 - high), 2,
+                                  2 ** (high - low - 1), 2, 2 ** low)
+        if control > target:
+            amp0, amp1 = view[:, 1, :, 0, :], view[:, 1, :, 1, :]
+        else:
+            amp0, amp1 = view[:, 0, :, 1, :], view[:, 1, :, 1, :]
+        _mix(amp0, amp1, np.asarray(gate).tolist(), self.BLOCK)
+        return self
+
+    # STANDARD GATE SET
+    def h(self, qubit):
+        return self.apply_gate(np.array([[1, 1], [1, -1]]) / np.sqrt(2), qubit)
+
+    def x(self, qubit):
+        return self.apply_gate([[0, 1], [1, 0]], qubit)
+
+    def z(self, qubit):
+        return self.apply_gate([[1, 0], [0, -1]], qubit)
+
+    def ry(self, theta, qubit):
+        c, s = np.cos(theta / 2), np.sin(theta / 2)
+        return self.apply_gate([[c, -s], [s, c]], qubit)
+
+    def rz(self, phi, qubit):
+        return self.apply_gate([[np.exp(-0.5j * phi), 0], [0, np.exp(0.5j * phi)]], qubit)
+
+    def cx(self, control, target):
+        return self.apply_controlled([[0, 1], [1, 0]], control, target)
+
+    def cz(self, control, target):
+        return self.apply_controlled([[1, 0], [0, -1]], control, target)
+
+    def sample_counts(self, shots, rng=None):
+        """
+        Born-rule measurement of every qubit, `shots` times, in one multinomial draw.
+        Returns a Qiskit-style counts dict of bitstrings.
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        probabilities = self.get_probabilities()
+        counts = rng.multinomial(shots, probabilities / probabilities.sum())
+        return {format(int(i), f'0{self.num_qubits}b'): int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def expectation(self, operator, qubit=None):
+        """
+        Reads a QuantumOperator: on the full register, or as a
+        single-qubit observable on `qubit` (without touching the state).
+        """
+        if qubit is None:
+            return operator.observe(self)
+        (o00, o01), (o10, o11) = np.asarray(operator.matrix).tolist()
+        view = self.state.reshape(2 ** (self.num_qubits - 1 - qubit), 2, 2 ** qubit)
+        amp0, amp1 = view[:, 0, :], view[:, 1, :]
+        return np.real(np.vdot(amp0, o00 * amp0 + o01 * amp1) + np.vdot(amp1, o10 * amp0 + o11 * amp1))
+
+    def __repr__(self):
+        return f"StateVector({self.num_qubits} qubits)"
+
 # Learning Note: 
 # The 'Born Rule' is the specific point where the 'woo' often enters. 
 # In standard physics, it's just a probability calculation.
\ No newline at end of file
@@ -1,54 +1,72 @@
 import os
+import sys
+import json
+import hashlib
+import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
-import matplotlib.pyplot as plt
-from qiskit import QuantumCircuit
-from qiskit.visualization import plot_histogram
-from qiskit_aer import AerSimulator
-from core_physics.harmonic_oscillator import HarmonicOscillator
-from core_physics.neuro_state import NeuroSubsystem
-from core_physics.universal_clock import UniversalClock
-from core_physics.auditor_logic import AuditorLogic
-
-def generate_lab_report():
-    print("🚀 Initializing Lab Asset Generation (IBM Style Standard)...")
-    if not os.path.exists('docs'): os.makedirs('docs')
-
-    # 1. Bell State Circuit
-    # ---------------------------------------------------------
-    qc = QuantumCircuit(2)
-    qc.h(0); qc.cx(0, 1)
-    qc.draw(output='mpl', filename='docs/bell_state_circuit.png')
-    print("✅ Bell State Circuit saved.")
-
-    # 2. Manifestation Histogram
-    # ---------------------------------------------------------
-    qc_render = QuantumCircuit(1, 1)
-    qc_render.ry(0.7 * np.pi, 0); qc_render.measure(0, 0)
-    sim = AerSimulator()
-    counts = sim.run(qc_render, shots=1024).result().get_counts()
-    plot_histogram(counts, title="Manifestation Probability (State Collapse)").savefig('docs/manifestation_probabilities.png')
-    print("✅ Manifestation Histogram saved.")
-
-    # 3. Energy Index Chart
-    # ---------------------------------------------------------
-    levels = np.array([-1, 0, 1, 2])
-    labels = ['Dirac Sea (-1)', 'Ground (0)', 'L=1 (Hydrogen)', 'L=2 (Hydrogen)']
+
+# Heavy imports (matplotlib, qiskit, the simulators) happen inside each chart task,
+# so a no-op rebuild only pays for hashing.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT) # Root anchor for core_physics imports (also inside pool workers)
+DOCS = os.path.join(ROOT, 'docs')
+MANIFEST = os.path.join(DOCS, '.asset_manifest.json')
+
+def neuro_recovery_purity(noise, correction):
+    """Vectorized sweep model: purity of pure PFC states after noise, then Phased Array correction."""
+    from core_physics.neuro_state import NeuroEnsemble
+    pfc = NeuroEnsemble.replicate(np.array([1, 0]), len(noise))
+    pfc.depolarize(noise)
+    pfc.realign(np.outer([1, 0], [1, 0]), correction)
+    return pfc.get_purity()
+
+def chronos_dilation(mass, vacuum_index):
+    """Vectorized sweep model: dilation for arrays of observer masses and vacuum indices."""
+    from core_physics.universal_clock import ClockEnsemble
+    return ClockEnsemble(observer_mass_kg=mass, vacuum_index=vacuum_index).calculate_dilation()
+
+# 1. Bell State Circuit
+# ---------------------------------------------------------
+def render_bell_state_circuit(path):
+    from core_physics.circuit_registry import registry
+    qc = registry.template("bell_state")
+    qc.draw(output='mpl', filename=path)
+
+# 2. Manifestation Histogram
+# ---------------------------------------------------------
+def render_manifestation_histogram(path, intention, shots):
+    from qiskit.visualization import plot_histogram
+    from core_physics.circuit_registry import registry, get_simulator
+    sim = get_simulator()
+    qc_render = registry.bind("ry_render", sim, theta=intention * np.pi)
+    counts = sim.run(qc_render, shots=shots).result().get_counts()
+    plot_histogram(counts, title="Manifestation Probability (State Collapse)").savefig(path)
+
+# 3. Energy Index Chart
+# ---------------------------------------------------------
+def render_energy_indices(path, levels, labels):
+    import matplotlib.pyplot as plt
+    levels = np.array(levels)
     plt.figure(figsize=(10, 6))
     plt.hlines(levels, 0, 1, colors=['red', 'black', 'blue', 'green'], linewidth=2)
-    for i, txt in enumerate(labels): 
+    for i, txt in enumerate(labels):
         plt.annotate(txt, (1.02, levels[i]), fontsize=12, verticalalignment='center')
     plt.title("Quantum State Array: Global Energy Indices", fontsize=14, fontweight='bold')
     plt.ylabel("Energy Eigenvalues (n)", fontsize=12)
     plt.grid(axis='y', linestyle='--', alpha=0.7)
     plt.tight_layout()
-    plt.savefig('docs/energy_indices.png')
-    print("✅ Energy Index Chart saved.")
-
-    # 4. Vibration-Mass Slope
-    # ---------------------------------------------------------
-    box = HarmonicOscillator(omega=2.0, mass_zero=1.0)
-    n = np.arange(0, 10)
-    masses = [box.get_invariant_mass(lvl) for lvl in n]
+    plt.savefig(path)
+
+# 4. Vibration-Mass Slope
+# ---------------------------------------------------------
+def render_vibration_mass_slope(path, omega, mass_zero, max_level):
+    import matplotlib.pyplot as plt
+    from core_physics.harmonic_oscillator import HarmonicOscillator
+    box = HarmonicOscillator(omega=omega, mass_zero=mass_zero)
+    n = np.arange(0, max_level)
+    masses = box.get_invariant_mass(n)
     plt.figure(figsize=(10, 6))
     plt.plot(n, masses, 'o-', color='#800080', linewidth=2, markersize=8, label=r'$m = E/c^2$')
     plt.title("The Kinetic-Mass Bridge: Vibration vs. Invariant Mass", fontsize=14, fontweight='bold')
@@ -57,20 +75,17 @@ def generate_lab_report():
     plt.grid(True, linestyle='--', alpha=0.6)
     plt.legend()
     plt.tight_layout()
-    plt.savefig('docs/vibration_mass_slope.png')
-    print("✅ Vibration-Mass Slope saved.")
-
-    # 5. Neuro-Purity Recovery Heatmap
-    # ---------------------------------------------------------
-    noise = np.linspace(0, 1, 10)
-    corr = np.linspace(0, 1, 10)
-    p_map = np.zeros((10, 10))
-    for i, n_val in enumerate(noise):
-        for j, c_val in enumerate(corr):
-            pfc = NeuroSubsystem(np.array([1, 0]))
-            pfc.rho = (1-n_val)*pfc.rho + n_val*0.5*np.eye(2)
-            pfc.rho = (1-c_val)*pfc.rho + c_val*np.outer([1, 0], [1, 0])
-            p_map[i, j] = pfc.get_purity()
+    plt.savefig(path)
+
+# 5. Neuro-Purity Recovery Heatmap
+# ---------------------------------------------------------
+def render_neuro_purity_recovery(path, resolution):
+    import matplotlib.pyplot as plt
+    from core_physics.parameter_sweep import run_sweep
+    noise = np.linspace(0, 1, resolution)
+    corr = np.linspace(0, 1, resolution)
+    p_map = run_sweep(neuro_recovery_purity, {"noise": noise, "correction": corr},
+                      vectorized=True, workers=1)
     plt.figure(figsize=(10, 8))
     plt.imshow(p_map, extent=[0, 1, 0, 1], origin='lower', cmap='plasma', aspect='auto')
     plt.colorbar(label=r'Purity Score [$Tr(\rho^2)$]')
@@ -78,30 +93,30 @@ def generate_lab_report():
     plt.xlabel("Correction Strength (Phased Array Intensity)", fontsize=12)
     plt.ylabel("Noise Level (Environmental Decoherence)", fontsize=12)
     plt.tight_layout()
-    plt.savefig('docs/neuro_purity_recovery.png')
-    print("✅ Neuro-Purity Heatmap saved.")
-
-    # 6. Chronos Dilation Map
-    # ---------------------------------------------------------
-    mass_range = np.linspace(1, 100000, 20)
-    v_indices = np.linspace(-1, 1, 20)
-    d_map = np.zeros((20, 20))
-    for i, m in enumerate(mass_range):
-        for j, v in enumerate(v_indices):
-            clock = UniversalClock(observer_mass_kg=m, vacuum_index=v)
-            d_map[i, j] = clock.calculate_dilation()
+    plt.savefig(path)
+
+# 6. Chronos Dilation Map
+# ---------------------------------------------------------
+def render_chronos_dilation_map(path, resolution, max_mass):
+    import matplotlib.pyplot as plt
+    from core_physics.parameter_sweep import run_sweep
+    mass_range = np.linspace(1, max_mass, resolution)
+    v_indices = np.linspace(-1, 1, resolution)
+    d_map = run_sweep(chronos_dilation, {"mass": mass_range, "vacuum_index": v_indices},
+                      vectorized=True, workers=1)
     plt.figure(figsize=(10, 8))
-    plt.imshow(d_map, extent=[-1, 1, 1, 100000], aspect='auto', origin='lower', cmap='viridis')
+    plt.imshow(d_map, extent=[-1, 1, 1, max_mass], aspect='auto', origin='lower', cmap='viridis')
     plt.colorbar(label=r'Dilation Factor ($t_{obs} / t_{univ}$)')
     plt.title("Project Chronos: Relativistic Time Dilation", fontsize=14, fontweight='bold')
     plt.xlabel("Vacuum Index (Negative = Warp | Positive = Gravity)", fontsize=12)
     plt.ylabel("Observer Mass (kg)", fontsize=12)
     plt.tight_layout()
-    plt.savefig('docs/chronos_dilation_map.png')
-    print("✅ Chronos Dilation Map saved.")
+    plt.savefig(path)
 
-    # 7. Light Cone & Wormhole Topology
-    # ---------------------------------------------------------
+# 7. Light Cone & Wormhole Topology
+# ---------------------------------------------------------
+def render_light_cone_bypass(path):
+    import matplotlib.pyplot as plt
     x = np.linspace(-15, 15, 100)
     plt.figure(figsize=(10, 10))
     plt.fill_between(x, np.abs(x), 15, color='#d3d3d3', alpha=0.4, label='Causal Future')
@@ -113,29 +128,27 @@ def generate_lab_report():
     plt.legend(loc='upper left')
     plt.xlim(-12, 12); plt.ylim(0, 12)
     plt.tight_layout()
-    plt.savefig('docs/light_cone_bypass.png')
-    print("✅ Light Cone Bypass Graph saved.")
-
-    # 8. NEW: Auditor Logic - Intent Purity vs. Market Time
-    # ---------------------------------------------------------
-    print("⏳ Generating Auditor State-Sync Map...")
-    auditor = AuditorLogic(observer_mass=80, vacuum_index=-1)
-    time_steps = np.arange(0, 50)
-    purities = []
-    
+    plt.savefig(path)
+
+# 8. Auditor Logic - Intent Purity vs. Market Time
+# ---------------------------------------------------------
+def render_auditor_state_sync(path, steps, observer_mass, vacuum_index):
+    import matplotlib.pyplot as plt
+    from core_physics.auditor_logic import AuditorLogic
+    auditor = AuditorLogic(observer_mass=observer_mass, vacuum_index=vacuum_index)
+    time_steps = np.arange(0, steps)
+
     # Simulate a stream of intent with fluctuating environmental noise
-    for t in time_steps:
-        # Intent fluctuates but maintains a core "Spirit" signal
-        sim_intent = "Synchronizing Universe..." if t % 5 == 0 else "Background Noise"
-        result = auditor.process_intent_state(sim_intent)
-        purities.append(result["purity_score"])
+    # Intent fluctuates but maintains a core "Spirit" signal
+    sim_intents = ["Synchronizing Universe..." if t % 5 == 0 else "Background Noise" for t in time_steps]
+    purities = [result["purity_score"] for result in auditor.process_intents(sim_intents)]
 
     plt.figure(figsize=(12, 6))
     plt.plot(time_steps, purities, color='#00FFFF', linewidth=2.5, label='Auditor Purity')
     plt.axhline(y=0.85, color='r', linestyle='--', label='Stargate Threshold (Coherence)')
-    
+
     plt.fill_between(time_steps, 0.85, 1.0, color='green', alpha=0.1, label='Metric Fold Zone')
-    
+
     plt.title("The Network Auditor: Intent Coherence vs. Market Latency", fontsize=16, fontweight='bold')
     plt.xlabel("Relative Interaction Time (Sequential Pings)", fontsize=12)
     plt.ylabel("Coherence Purity Score", fontsize=12)
@@ -143,10 +156,109 @@ def generate_lab_report():
     plt.grid(True, linestyle=':', alpha=0.5)
     plt.legend(loc='lower right', framealpha=1)
     plt.tight_layout()
-    plt.savefig('docs/auditor_state_sync.png')
-    print("✅ Auditor State-Sync Map saved.")
+    plt.savefig(path)
+
+# ASSET REGISTRY
+# Each chart declares its inputs; a chart is only re-rendered when those, this
+# script or any core_physics module change (or its PNG is missing).
+ASSET_TASKS = [
+    {"name": "Bell State Circuit", "file": "bell_state_circuit.png",
+     "render": render_bell_state_circuit, "inputs": {}},
+    {"name": "Manifestation Histogram", "file": "manifestation_probabilities.png",
+     "render": render_manifestation_histogram, "inputs": {"intention": 0.7, "shots": 1024}},
+    {"name": "Energy Index Chart", "file": "energy_indices.png",
+     "render": render_energy_indices,
+     "inputs": {"levels": [-1, 0, 1, 2],
+                "labels": ['Dirac Sea (-1)', 'Ground (0)', 'L=1 (Hydrogen)', 'L=2 (Hydrogen)']}},
+    {"name": "Vibration-Mass Slope", "file": "vibration_mass_slope.png",
+     "render": render_vibration_mass_slope, "inputs": {"omega": 2.0, "mass_zero": 1.0, "max_level": 10}},
+    {"name": "Neuro-Purity Heatmap", "file": "neuro_purity_recovery.png",
+     "render": render_neuro_purity_recovery, "inputs": {"resolution": 10}},
+    {"name": "Chronos Dilation Map", "file": "chronos_dilation_map.png",
+     "render": render_chronos_dilation_map, "inputs": {"resolution": 20, "max_mass": 100000}},
+    {"name": "Light Cone Bypass Graph", "file": "light_cone_bypass.png",
+     "render": render_light_cone_bypass, "inputs": {}},
+    {"name": "Auditor State-Sync Map", "file": "auditor_state_sync.png",
+     "render": render_auditor_state_sync, "inputs": {"steps": 50, "observer_mass": 80, "vacuum_index": -1}},
+]
+
+def source_digest():
+    """
+    Hash of this script and every core_physics module. Charts import those
+    modules transitively, so any edit to them (or to a render function or sweep
+    model here) counts as a change for every chart.
+    """
+    digest = hashlib.sha256()
+    sources = [os.path.abspath(__file__)] + sorted(glob.glob(os.path.join(ROOT, 'core_physics', '*.py')))
+    for source in sources:
+        digest.update(os.path.relpath(source, ROOT).encode())
+        with open(source, 'rb') as handle:
+            digest.update(handle.read())
+    return digest.hexdigest()
+
+def task_hash(task, sources=None):
+    """Content hash of a chart's file name, declared inputs and the source digest."""
+    digest = hashlib.sha256()
+    digest.update(task["file"].encode())
+    digest.update(json.dumps(task["inputs"], sort_keys=True).encode())
+    digest.update((source_digest() if sources is None else sources).encode())
+    return digest.hexdigest()
+
+def load_manifest():
+    if not os.path.exists(MANIFEST):
+        return {}
+    with open(MANIFEST) as handle:
+        return json.load(handle)
+
+def save_manifest(manifest):
+    with open(MANIFEST, 'w') as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+
+def run_task(index):
+    """Renders ASSET_TASKS[index] (by index, so it pickles cleanly into pool workers)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    task = ASSET_TASKS[index]
+    task["render"](os.path.join(DOCS, task["file"]), **task["inputs"])
+    plt.close('all')
+    return index
+
+def generate_lab_report(force=False, workers=None):
+    print("🚀 Initializing Lab Asset Generation (IBM Style Standard)...")
+    os.makedirs(DOCS, exist_ok=True)
+
+    manifest = {} if force else load_manifest()
+    sources = source_digest()
+    hashes = [task_hash(task, sources) for task in ASSET_TASKS]
+    stale = [i for i, task in enumerate(ASSET_TASKS)
+             if manifest.get(task["file"]) != hashes[i]
+             or not os.path.exists(os.path.join(DOCS, task["file"]))]
+
+    for i, task in enumerate(ASSET_TASKS):
+        if i not in stale:
+            print(f"⏭️  {task['name']} unchanged.")
+
+    def record(index):
+        manifest[ASSET_TASKS[index]["file"]] = hashes[index]
+        save_manifest(manifest)
+        print(f"✅ {ASSET_TASKS[index]['name']} saved.")
+
+    workers = min(len(stale), workers or os.cpu_count() or 1)
+    if workers <= 1:
+        for index in stale:
+            record(run_task(index))
+    elif stale:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for future in as_completed([pool.submit(run_task, index) for index in stale]):
+                record(future.result())
 
     print("\n🔬 All systems coherent. All receipts generated. Ready for commit.")
 
 if __name__ == "__main__":
-    generate_lab_report()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Render the lab ledger charts into docs/.")
+    parser.add_argument('--force', action='store_true', help="Re-render every chart, ignoring the manifest.")
+    parser.add_argument('--workers', type=int, default=None, help="Process count (default: all cores).")
+    args = parser.parse_args()
+    generate_lab_report(force=args.force, workers=args.workers)
@@ -1,18 +1,131 @@
-def calculate_bayes_factor(successes, trials, null_prob=0.5):
+import numpy as np
+
+def log_bayes_factor(successes, trials, null_prob=0.5, shift=0.01):
+    """
+    Vectorized log Bayes Factor: log[ P(data | H1) / P(data | H0) ].
+
+    successes, trials: Scalars or arrays (broadcast together, e.g. one entry per session).
+    shift: Scalar or array of alternative shifts (H1: p = null_prob + shift).
+        An array of shifts adds trailing axes, so sessions x alternatives comes
+        back as a full grid in one call.
+
+    Works in log-space: the binomial coefficient C(n, k) is shared by H0 and H1
+    and cancels exactly, leaving
+        k * log(p1 / p0) + (n - k) * log((1 - p1) / (1 - p0))
+    which stays finite for millions of trials where the raw pmf ratio is 0/0.
+    """
+    successes, trials = np.broadcast_arrays(np.asarray(successes, dtype=float),
+                                            np.asarray(trials, dtype=float))
+    shifts = np.asarray(shift, dtype=float)
+    alt_prob = null_prob + shifts
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_hit = np.log(alt_prob) - np.log(null_prob)
+        log_miss = np.log1p(-alt_prob) - np.log1p(-null_prob)
+
+    # Sessions along the leading axes, alternatives along the trailing ones
+    expand = (Ellipsis,) + (np.newaxis,) * shifts.ndim
+    hits, misses = successes[expand], (trials - successes)[expand]
+
+    # 0 * log(0) counts as 0: an impossible outcome that never happened costs nothing
+    with np.errstate(invalid='ignore'):
+        log_bf = np.where(hits > 0, hits * log_hit, 0.0) + np.where(misses > 0, misses * log_miss, 0.0)
+
+    # Outside 0 <= k <= n the data is impossible under both hypotheses
+    valid = (hits >= 0) & (misses >= 0)
+    return np.where(valid, log_bf, np.nan)
+
+def calculate_bayes_factor(successes, trials, null_prob=0.5, shift=0.01):
     """
     Compares H0 (Chance) vs H1 (Psi/Anomalous influence).
     The Bayes Factor tells you how much more likely H1 is than H0.
+    H1 is a hypothetical shift, e.g., 51% instead of 50% (shift=0.01).
+    Accepts arrays like log_bayes_factor; prefer the log form for huge trial counts.
+    """
+    return np.exp(log_bayes_factor(successes, trials, null_prob, shift))
+
+class SequentialBayesTracker:
     """
-    from scipy.stats import binom
-    
-    # Likelihood of data under H0 (Standard Randomness)
-    likelihood_h0 = binom.pmf(successes, trials, null_prob)
-    
-    # Likelihood of data under H1 (Hypothetical Shift, e.g., 51% instead of 50%)
-    likelihood_h1 = binom.pmf(successes, trials, null_prob + 0.01)
-    
-    bayes_factor = likelihood_h1 / likelihood_h0
-    return bayes_factor
+    Live Bayes Factor for a stream of psi trials.
+
+    Keeps only the running sufficient statistics (successes, trials) and the
+    per-alternative log Bayes Factor, so each trial is an O(K) update for K
+    simultaneous alternative shifts. Crossing the evidence threshold (BF > threshold
+    for H1, BF < 1/threshold for H0) emits an event for early stopping.
+    """
+    def __init__(self, shifts=(0.01,), null_prob=0.5, threshold=3.0, callback=None):
+        """
+        :param shifts: One or more alternative shifts (H1: p = null_prob + shift).
+        :param threshold: Bayes Factor that counts as 'substantial' evidence.
+        :param callback: Optional callable invoked with each event dict as it fires.
+        """
+        self.shifts = np.atleast_1d(np.asarray(shifts, dtype=float))
+        self.null_prob = null_prob
+        self.log_threshold = np.log(threshold)
+        self.callback = callback
+
+        alt_prob = null_prob + self.shifts
+        self._log_hit = np.log(alt_prob) - np.log(null_prob)
+        self._log_miss = np.log1p(-alt_prob) - np.log1p(-null_prob)
+
+        self.successes = 0
+        self.trials = 0
+        self.log_bf = np.zeros(len(self.shifts))
+        self._zone = np.zeros(len(self.shifts), dtype=int) # +1 H1 zone, -1 H0 zone, 0 undecided
+        self.events = []
+
+    @property
+    def bayes_factor(self):
+        return np.exp(self.log_bf)
+
+    def _zones(self, log_bf):
+        return (log_bf >= self.log_threshold).astype(int) - (log_bf <= -self.log_threshold)
+
+    def _emit(self, trial, alternative, log_bf):
+        event = {
+            "trial": int(trial),
+            "shift": float(self.shifts[alternative]),
+            "hypothesis": "H1" if log_bf > 0 else "H0",
+            "bayes_factor": float(np.exp(log_bf))
+        }
+        self.events.append(event)
+        if self.callback is not None:
+            self.callback(event)
+        return event
+
+    def update(self, outcome):
+        """One trial (truthy = hit). Returns the list of events it triggered."""
+        hit = bool(outcome)
+        self.successes += hit
+        self.trials += 1
+        self.log_bf += self._log_hit if hit else self._log_miss
+
+        zone = self._zones(self.log_bf)
+        entered = np.flatnonzero((zone != self._zone) & (zone != 0))
+        self._zone = zone
+        return [self._emit(self.trials, k, self.log_bf[k]) for k in entered]
+
+    def update_batch(self, outcomes):
+        """
+        A block of trials at once. The log-BF path is rebuilt with one cumulative
+        sum, so every threshold crossing inside the block is reported at its exact trial.
+        """
+        hits = np.asarray(outcomes, dtype=bool)
+        if hits.size == 0:
+            return []
+        steps = np.where(hits[:, None], self._log_hit, self._log_miss)
+        path = self.log_bf + np.cumsum(steps, axis=0)
+
+        zones = self._zones(path)
+        previous = np.vstack([self._zone, zones[:-1]])
+        rows, alternatives = np.nonzero((zones != previous) & (zones != 0))
+
+        first_trial = self.trials + 1
+        self.successes += int(hits.sum())
+        self.trials += len(hits)
+        self.log_bf = path[-1].copy()
+        self._zone = zones[-1]
+        return [self._emit(first_trial + r, k, path[r, k]) for r, k in zip(rows, alternatives)]
 
 # Advice: If Bayes Factor > 3, it's 'substantial' evidence. 
-# If it's < 1, the 'Mind' hypothesis is losing to standard physics.
\ No newline at end of file
+# If it's < 1, the 'Mind' hypothesis is losing to standard physics.
@@ -1,11 +1,16 @@
 import unittest
 import sys
 import os
+import asyncio
+import numpy as np
 
 # Root anchor for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from unittest import mock
+from core_physics import auditor_logic
 from core_physics.auditor_logic import AuditorLogic
+from core_physics.random_streams import spawn
 
 class TestAuditor(unittest.TestCase):
     def setUp(self):
@@ -61,5 +66,135 @@ class TestAuditor(unittest.TestCase):
         self.assertGreater(dilation, 1.0)
         print("✅ Vacuum Acceleration Verified: Auditor is operating 'Elsewhere'.")
 
+    def test_batch_matches_sequential(self):
+        """
+        process_intents is a drop-in for N sequential process_intent_state calls:
+        same seed in, identical pulses, braid and final density matrix out.
+        """
+        intents = ["Synchronizing Universe...", "Background Noise", "", "aaaa", "Ωmega ψ field ∞",
+                   "abc\x00\x00\x00\x00\x00", "\x00"] * 20
+
+        sequential_auditor = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=7)
+        sequential = [sequential_auditor.process_intent_state(intent) for intent in intents]
+
+        batched_auditor = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=7)
+        batched = batched_auditor.process_intents(intents)
+
+        self.assertEqual(len(batched), len(intents))
+        for expected, actual in zip(sequential, batched):
+            self.assertAlmostEqual(expected["purity_score"], actual["purity_score"])
+            self.assertEqual(expected["causal_status"], actual["causal_status"])
+        self.assertTrue(np.allclose(sequential_auditor.observer.rho, batched_auditor.observer.rho))
+        self.assertAlmostEqual(sequential_auditor.clock.entropy_state, batched_auditor.clock.entropy_state)
+        print("✅ Batch Audit Verified: Identical braid to sequential pulses.")
+
+    def test_vectorized_recurrence_is_exact(self):
+        """
+        intent_purities reproduces the sequential pulses bit for bit, also when the
+        Jacobi sweeps give up early and the scalar loop finishes the batch.
+        """
+        rng = np.random.default_rng(8)
+        alphabet = np.array(list("abcdefghijklmnopqrstuvwxyz "))
+        intents = ["".join(rng.choice(alphabet, size=n)) for n in rng.integers(1, 60, size=3000)]
+
+        sequential_auditor = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=21)
+        sequential = [sequential_auditor.process_intent_state(intent)["purity_score"] for intent in intents]
+
+        for max_sweeps in (auditor_logic.MAX_SWEEPS, 1, 0):
+            with mock.patch.object(auditor_logic, "MAX_SWEEPS", max_sweeps):
+                batched_auditor = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=21)
+                self.assertEqual(batched_auditor.intent_purities(intents).tolist(), sequential)
+                np.testing.assert_array_equal(batched_auditor.observer.rho, sequential_auditor.observer.rho)
+
+        compact = AuditorLogic(observer_mass=80, vacuum_index=-1, compact=True, seed=21)
+        np.testing.assert_allclose(compact.intent_purities(intents), sequential)
+
+    def test_intent_features_match_python(self):
+        """Batch features equal len(set(s)), len(s) and sum(map(ord, s)), NULs and all."""
+        intents = ["ab\x00", "", "\x00\x00", "Ωmega ψ field ∞", "a" * 1000, "\ud800x"]
+        unique, total, ordinal = AuditorLogic.intent_features(intents)
+        self.assertEqual(unique.tolist(), [len(set(s)) for s in intents])
+        self.assertEqual(total.tolist(), [len(s) for s in intents])
+        self.assertEqual(ordinal.tolist(), [sum(map(ord, s)) for s in intents])
+        self.assertEqual([len(f) for f in AuditorLogic.intent_features([])], [0, 0, 0])
+
+        # ASCII-only batches take the byte-table path
+        intents = ["ab\x00", "", "\x00\x00", "Background Noise", "a" * 1000]
+        unique, total, ordinal = AuditorLogic.intent_features(intents)
+        self.assertEqual(unique.tolist(), [len(set(s)) for s in intents])
+        self.assertEqual(total.tolist(), [len(s) for s in intents])
+        self.assertEqual(ordinal.tolist(), [sum(map(ord, s)) for s in intents])
+
+    def test_compact_observer(self):
+        """The Bloch-vector observer produces the same braid as the density matrix."""
+        intents = ["Synchronizing Universe...", "Background Noise", "aaaa"] * 10
+
+        full_auditor = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=5)
+        full = [full_auditor.process_intent_state(intent)["purity_score"] for intent in intents]
+
+        compact_auditor = AuditorLogic(observer_mass=80, vacuum_index=-1, compact=True, seed=5)
+        compact = [compact_auditor.process_intent_state(intent)["purity_score"] for intent in intents]
+
+        for expected, actual in zip(full, compact):
+            self.assertAlmostEqual(expected, actual)
+        print("✅ Compact Observer Verified.")
+
+    def test_stream_matches_sequential(self):
+        """
+        The async pipeline must see the same intents in the same order
+        as direct sequential calls (same seed, same braid).
+        """
+        intents = ["Synchronizing Universe..." if i % 5 == 0 else "Background Noise" for i in range(40)]
+
+        sequential_auditor = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=42)
+        sequential = [sequential_auditor.process_intent_state(intent)["purity_score"] for intent in intents]
+
+        async def feed():
+            for intent in intents:
+                yield intent
+                await asyncio.sleep(0)
+
+        async def consume(auditor):
+            return [result["purity_score"] async for result in auditor.process_stream(feed(), batch_size=8, max_queue=4)]
+
+        streamed = asyncio.run(consume(AuditorLogic(observer_mass=80, vacuum_index=-1, seed=42)))
+
+        self.assertEqual(len(streamed), len(intents))
+        for expected, actual in zip(sequential, streamed):
+            self.assertAlmostEqual(expected, actual)
+        print("✅ Stream Ordering Verified: Braid identical to sequential audit.")
+
+    def test_stream_closes_early_with_full_queue(self):
+        """Stopping the consumer while the bounded queue is full must not hang the shutdown."""
+        async def endless():
+            while True:
+                yield "Background Noise"
+                await asyncio.sleep(0)
+
+        async def take_one():
+            stream = self.auditor.process_stream(endless(), batch_size=2, max_queue=4)
+            async for _ in stream:
+                break
+            await asyncio.sleep(0.3) # let the producer fill the queue
+            await asyncio.wait_for(stream.aclose(), timeout=2)
+            await asyncio.sleep(0) # let the finished close task settle
+            return [task for task in asyncio.all_tasks() if task is not asyncio.current_task() and not task.done()]
+
+        self.assertEqual(asyncio.run(take_one()), [])
+
+    def test_seeded_runs_reproduce(self):
+        """Same seed, same braid; spawned child streams give independent auditors."""
+        intents = ["Synchronizing Universe...", "Background Noise"] * 50
+        first = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=2024).process_intents(intents)
+        second = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=2024).process_intents(intents)
+        self.assertEqual(first, second)
+
+        left, right = spawn(2024, 2)
+        left_clock = AuditorLogic(seed=left).clock
+        right_clock = AuditorLogic(seed=right).clock
+        left_clock.tick_many(100)
+        right_clock.tick_many(100)
+        self.assertNotEqual(left_clock.entropy_state, right_clock.entropy_state)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
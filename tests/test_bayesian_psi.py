@@ -0,0 +1,65 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Root anchor for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scipy.stats import binom
+from speculative_math.bayesian_psi import calculate_bayes_factor, log_bayes_factor, SequentialBayesTracker
+
+class TestBayesianPsi(unittest.TestCase):
+    def test_matches_binomial_ratio(self):
+        """For small sessions the log-space engine equals the raw pmf ratio."""
+        for successes, trials in [(52, 100), (480, 1000), (0, 10), (10, 10)]:
+            expected = binom.pmf(successes, trials, 0.51) / binom.pmf(successes, trials, 0.5)
+            self.assertAlmostEqual(calculate_bayes_factor(successes, trials) / expected, 1.0)
+        print("✅ Bayes Factor Matches Binomial Ratio.")
+
+    def test_session_grid(self):
+        """Sessions x alternatives in one call, finite even at millions of trials."""
+        successes = np.array([5_010_000, 5_000_000, 4_990_000])
+        trials = np.full(3, 10_000_000)
+        shifts = np.array([0.001, 0.002, -0.001])
+
+        grid = log_bayes_factor(successes, trials, shift=shifts)
+        self.assertEqual(grid.shape, (3, 3))
+        self.assertTrue(np.all(np.isfinite(grid)))
+        # An excess of hits supports the upward shift; a deficit supports the downward one
+        self.assertGreater(grid[0, 0], 0)
+        self.assertLess(grid[2, 0], 0)
+        self.assertGreater(grid[2, 2], 0)
+        self.assertAlmostEqual(grid[1, 1], log_bayes_factor(5_000_000, 10_000_000, shift=0.002))
+        print(f"✅ Log Bayes Grid Verified:\n{np.round(grid, 2)}")
+
+    def test_sequential_tracker(self):
+        """
+        Streaming updates land on the same log Bayes Factor as a from-scratch
+        recomputation, and batch updates report crossings at the same trial.
+        """
+        rng = np.random.default_rng(9)
+        outcomes = rng.random(3000) < 0.56
+        shifts = [0.01, 0.05, -0.05]
+
+        streamed = SequentialBayesTracker(shifts=shifts, threshold=3.0)
+        stream_events = []
+        for outcome in outcomes:
+            stream_events.extend(streamed.update(outcome))
+
+        batched = SequentialBayesTracker(shifts=shifts, threshold=3.0)
+        batch_events = batched.update_batch(outcomes[:1234]) + batched.update_batch(outcomes[1234:])
+
+        expected = log_bayes_factor(outcomes.sum(), len(outcomes), shift=np.array(shifts))
+        np.testing.assert_allclose(streamed.log_bf, expected)
+        np.testing.assert_allclose(batched.log_bf, expected)
+        crossing = lambda events: [(e["trial"], e["shift"], e["hypothesis"]) for e in events]
+        self.assertEqual(crossing(stream_events), crossing(batch_events))
+
+        # A 56% hit rate must eventually favour the +5% alternative
+        self.assertIn((0.05, "H1"), [(e["shift"], e["hypothesis"]) for e in stream_events])
+        self.assertEqual(streamed.trials, 3000)
+        print(f"✅ Sequential Tracker Verified: first event {stream_events[0]}")
+
+if __name__ == "__main__":
+    unittest.main()
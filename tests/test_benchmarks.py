@@ -0,0 +1,40 @@
+import unittest
+import sys
+import os
+
+# Root anchor for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.run_benchmarks import BENCHMARKS, compare_results, run_benchmarks, time_callable
+
+class TestBenchmarkHarness(unittest.TestCase):
+    def test_hot_paths_are_registered(self):
+        for name in ("auditor.process_intent_state", "clock.tick", "neuro.get_purity",
+                     "neuro.apply_error_correction", "render.manifest_object",
+                     "bell.run_bell_test", "oscillator.LadderOperator",
+                     "bayes.calculate_bayes_factor"):
+            self.assertIn(name, BENCHMARKS)
+
+    def test_timing_reports_per_call_seconds(self):
+        timing = time_callable(lambda: sum(range(100)), repeat=3, min_time=0.001)
+        self.assertLessEqual(timing["best"], timing["median"])
+        self.assertGreater(timing["calls"], 0)
+
+    def test_run_produces_json_ready_results(self):
+        current = run_benchmarks(["bayes"], quick=True, repeat=2, min_time=0.001)
+        self.assertEqual([(r["name"], r["size"]) for r in current["results"]],
+                         [("bayes.calculate_bayes_factor", 100)])
+        self.assertIn("numpy", current["meta"])
+
+    def test_baseline_comparison_flags_regressions(self):
+        baseline = {"results": [{"name": "a", "size": 1, "best": 1.0},
+                                {"name": "b", "size": 1, "best": 1.0}]}
+        current = {"results": [{"name": "a", "size": 1, "best": 1.1},
+                               {"name": "b", "size": 1, "best": 2.0},
+                               {"name": "c", "size": 1, "best": 9.0}]}
+        report = compare_results(current, baseline, tolerance=0.25)
+        self.assertEqual([(row["name"], row["regression"]) for row in report],
+                         [("a", False), ("b", True)])
+
+if __name__ == '__main__':
+    unittest.main()
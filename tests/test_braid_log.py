@@ -0,0 +1,87 @@
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+
+# Root anchor for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core_physics.braid_log import BraidLog
+from core_physics.auditor_logic import AuditorLogic
+
+class TestBraidLog(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, "braid")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_append_grows_and_readers_follow(self):
+        """Columns double past their capacity; a read-only view sees every committed pulse."""
+        writer = BraidLog(self.directory, capacity=4)
+        reader = BraidLog(self.directory, mode="r")
+        writer.append([0.95, 0.5, 0.91], 1.08)
+        self.assertEqual(len(reader), 3)
+
+        writer.append(np.linspace(0, 1, 1000), np.full(1000, 1.08))
+        self.assertEqual(writer.capacity, 1024)
+        self.assertEqual(reader.refresh(), 1003)
+        np.testing.assert_array_equal(reader.column("seq"), np.arange(1003))
+        np.testing.assert_array_equal(reader.column("locked")[:3], [True, False, True])
+        self.assertEqual(reader.tail(1), [{"purity": 1.0, "dilation": 1.08, "locked": True}])
+
+        with self.assertRaises(ValueError):
+            reader.column("purity")[0] = 0.0
+
+    def test_auditor_resumes_from_checkpoint(self):
+        """Checkpoint, crash, resume: the continued braid matches one uninterrupted run."""
+        intents = ["Synchronizing Universe...", "Background Noise", "aaaa", "Ωmega ψ field ∞"] * 25
+
+        reference = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=3)
+        expected = reference.process_intents(intents * 2)
+
+        first = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=3, braid_log=self.directory)
+        first.process_intents(intents)
+        first.checkpoint()
+        first.process_intent_state("lost after the crash")
+
+        resumed = AuditorLogic.resume(self.directory)
+        self.assertEqual(len(resumed.braid_log), len(intents))
+        self.assertEqual([entry["purity"] for entry in resumed.topological_braid],
+                         [r["purity_score"] for r in expected[len(intents) - 5:len(intents)]])
+        self.assertEqual(resumed.coherence_summary()["pulses"], len(intents))
+        self.assertEqual(resumed.process_intents(intents), expected[len(intents):])
+
+        np.testing.assert_allclose(resumed.observer.rho, reference.observer.rho)
+        np.testing.assert_allclose(BraidLog(self.directory, mode="r").column("purity"),
+                                   [r["purity_score"] for r in expected])
+
+    def test_resume_mid_lap(self):
+        """A pulse count that is not a multiple of the window resumes the ring in order."""
+        intents = ["Synchronizing Universe...", "Background Noise", "aaaa", "Ωmega ψ field ∞"] * 26
+
+        reference = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=11)
+        reference.process_intents(intents[:103])
+        expected_window = list(reference.topological_braid)
+        reference.process_intents(intents[103:])
+
+        first = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=11, braid_log=self.directory)
+        first.process_intents(intents[:103])
+        first.checkpoint()
+
+        resumed = AuditorLogic.resume(self.directory)
+        self.assertEqual(list(resumed.topological_braid), expected_window)
+        resumed.process_intents(intents[103:])
+        self.assertEqual(list(resumed.topological_braid), list(reference.topological_braid))
+        self.assertEqual(resumed.coherence_summary(), reference.coherence_summary())
+
+    def test_checkpoint_requires_braid_log(self):
+        auditor = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=3)
+        auditor.process_intent_state("Synchronizing Universe...")
+        with self.assertRaisesRegex(ValueError, "braid_log"):
+            auditor.checkpoint()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Root anchor for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core_physics.braid_ring import BraidRing
+from core_physics.auditor_logic import AuditorLogic
+
+class TestBraidRing(unittest.TestCase):
+    def test_rolling_statistics_match_full_history(self):
+        """Window max/mean/lock ratio agree with recomputing them from the full history."""
+        rng = np.random.default_rng(4)
+        ring = BraidRing(window=7)
+        history = []
+        for batch in [rng.uniform(0.5, 1.0, size) for size in (1, 3, 20, 2, 6, 40, 1)]:
+            ring.extend(batch, 1.08)
+            history.extend(batch.tolist())
+            recent = np.array(history[-7:])
+            self.assertEqual(ring.max_purity, recent.max())
+            self.assertAlmostEqual(ring.mean_purity, recent.mean())
+            self.assertAlmostEqual(ring.lock_ratio, np.mean(recent > 0.88))
+
+        self.assertEqual([entry["purity"] for entry in ring], history[-7:])
+        self.assertEqual(ring[-1]["purity"], history[-1])
+        self.assertEqual(ring.total_pulses, len(history))
+        self.assertEqual(ring.total_locks, sum(p > 0.88 for p in history))
+
+    def test_auditor_memory_is_constant(self):
+        """A long-running auditor keeps only the receipt window in memory."""
+        auditor = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=1)
+        self.assertEqual(auditor.generate_stargate_receipt(), "NO_DATA")
+        auditor.process_intents(["Coherent Signal Alignment"] * 5000)
+        auditor.process_intent_state("Coherent Signal Alignment")
+
+        self.assertEqual(len(auditor.topological_braid), 5)
+        summary = auditor.coherence_summary()
+        self.assertEqual(summary["pulses"], 5001)
+        self.assertEqual(summary["window_max_purity"],
+                         max(entry["purity"] for entry in auditor.topological_braid))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from core_physics.universal_clock import UniversalClock
+import numpy as np
+from core_physics.universal_clock import UniversalClock, ClockEnsemble
 
 class TestChronos(unittest.TestCase):
     def test_dilation_mechanics(self):
@@ -21,5 +22,56 @@ class TestChronos(unittest.TestCase):
         self.assertFalse(unreachable["visible"])
         print("✅ Causality Gates Verified.")
 
+    def test_advance_fast_forward(self):
+        """A billion ticks collapse into one analytic step."""
+        clock = UniversalClock(observer_mass_kg=70, vacuum_index=0)
+        report = clock.advance(10**9, duration_sec=2)
+
+        dilation = clock.calculate_dilation()
+        self.assertAlmostEqual(report["Universal_Time"], 2e9 * dilation)
+        self.assertAlmostEqual(clock.total_planck_ticks / (2e9 * dilation / clock.PLANCK_TIME), 1.0)
+        # Entropy mean: 0.003 * mass per tick
+        self.assertAlmostEqual(clock.entropy_state / (10**9 * 0.003 * 70), 1.0, places=3)
+        # Flares: ~5% of ticks
+        self.assertAlmostEqual(report["Interrupt_Summary"]["solar_flares"] / 10**9, 0.05, places=3)
+        self.assertTrue(clock.solar_flare_active)
+        print(f"✅ Fast-Forward Verified: {report['Interrupt_Summary']}")
+
+    def test_advance_matches_tick_loop(self):
+        """A short advance agrees with the tick loop on the deterministic totals."""
+        looped = UniversalClock(observer_mass_kg=500, vacuum_index=-1)
+        for _ in range(10):
+            looped.tick()
+        jumped = UniversalClock(observer_mass_kg=500, vacuum_index=-1)
+        jumped.advance(10)
+
+        self.assertAlmostEqual(jumped.total_planck_ticks / looped.total_planck_ticks, 1.0)
+        # 10 uniforms on [0.001, 0.005] bound the entropy either way
+        self.assertTrue(10 * 0.001 * 500 <= jumped.entropy_state <= 10 * 0.005 * 500)
+
+    def test_ensemble_matches_scalar_clocks(self):
+        """The ensemble is N independent UniversalClocks ticking in lockstep."""
+        masses = np.array([1, 80, 1000, 50000])
+        vacua = np.array([-1, 0, 1, -0.5])
+        ensemble = ClockEnsemble(masses, vacua, seed=7)
+        scalar = [UniversalClock(m, v).calculate_dilation() for m, v in zip(masses, vacua)]
+        np.testing.assert_allclose(ensemble.calculate_dilation(), scalar)
+
+        report = ensemble.tick(2)
+        np.testing.assert_allclose(report["Universal_Time"], 2 * np.array(scalar))
+        np.testing.assert_allclose(ensemble.total_planck_ticks, 2 * np.array(scalar) / ensemble.PLANCK_TIME)
+        print("✅ Ensemble Dilation Coherent.")
+
+    def test_ensemble_draw_statistics(self):
+        """Entropy and flare draws follow the scalar clock's distributions."""
+        ensemble = ClockEnsemble(np.full(200000, 70.0), seed=11)
+        report = ensemble.tick()
+
+        # E[U(0.001, 0.005)] * mass = 0.003 * 70
+        self.assertAlmostEqual(ensemble.entropy_state.mean(), 0.21, places=3)
+        self.assertAlmostEqual(report["Solar_Flares"].mean(), 0.05, places=2)
+        self.assertTrue(np.all(ensemble.solar_flare_active == report["Solar_Flares"]))
+        print(f"✅ Ensemble Flare Rate: {report['Solar_Flares'].mean():.4f}")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Root anchor for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from qiskit_aer import AerSimulator
+from core_physics.circuit_registry import CircuitRegistry
+
+class TestCircuitRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = CircuitRegistry(maxsize=2)
+        self.sim = AerSimulator()
+
+    def test_compile_once(self):
+        """The second request for a template is served from the cache."""
+        first = self.registry.compiled("bell_pair", self.sim)
+        second = self.registry.compiled("bell_pair", self.sim)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.registry.stats()["hits"], 1)
+        self.assertEqual(self.registry.stats()["misses"], 1)
+        print(f"✅ Compiled Once: {self.registry.stats()}")
+
+    def test_bind_and_run(self):
+        """Binding theta = pi on the RY template always renders '1'."""
+        qc = self.registry.bind("ry_render", self.sim, theta=np.pi)
+        counts = self.sim.run(qc, shots=64).result().get_counts()
+        self.assertEqual(counts, {'1': 64})
+
+    def test_lru_bound(self):
+        """The least recently used compiled circuit is evicted past maxsize."""
+        self.registry.compiled("bell_pair", self.sim)
+        self.registry.compiled("ry_render", self.sim)
+        self.registry.compiled("bell_pair", self.sim)
+        self.registry.compiled("bell_state", self.sim)
+
+        self.assertEqual(self.registry.stats()["size"], 2)
+        self.registry.compiled("bell_pair", self.sim)
+        self.assertEqual(self.registry.stats()["hits"], 2)
+
+        with self.assertRaises(KeyError):
+            self.registry.template("wormhole")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,9 +6,10 @@ import numpy as np
 # Ensure root path is accessible
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from core_physics.wave_mechanics import QuantumState
-from core_physics.bell_test import calculate_correlation
-from core_physics.operators import QuantumOperator
+from core_physics.wave_mechanics import QuantumState, StateVector
+from core_physics.bell_test import calculate_correlation, run_chsh_sweep, run_bell_test
+from core_physics.operators import QuantumOperator, observe_table, sigma_z
+from core_physics.harmonic_oscillator import number_operator
 
 class TestQuantumCore(unittest.TestCase):
     
@@ -23,6 +24,53 @@ class TestQuantumCore(unittest.TestCase):
         self.assertAlmostEqual(np.sum(probs), 1.0, places=5)
         print(f"✅ Normalization Conserved: {np.sum(probs)}")
 
+    def test_statevector_bell_pair(self):
+        """
+        The in-place n-qubit engine builds the Mirror Link without Aer:
+        H + CNOT gives (|00> + |11>) / sqrt(2), and sampled shots only ever agree.
+        """
+        bell = StateVector(2).h(0).cx(0, 1)
+        np.testing.assert_allclose(bell.get_probabilities(), [0.5, 0, 0, 0.5], atol=1e-12)
+        self.assertAlmostEqual(bell.expectation(QuantumOperator(np.kron([[1, 0], [0, -1]], [[1, 0], [0, -1]]), "ZZ")), 1.0)
+        self.assertAlmostEqual(bell.expectation(QuantumOperator([[1, 0], [0, -1]], "Z"), qubit=1), 0.0)
+
+        counts = run_bell_test(2000, backend="statevector")
+        self.assertEqual(set(counts) - {'00', '11'}, set())
+        self.assertEqual(calculate_correlation(counts), 1.0)
+        print(f"✅ StateVector Bell Pair Verified: {counts}")
+
+    def test_statevector_gate_blocks(self):
+        """
+        Block-wise application (tiny blocks) matches the dense Kronecker-product gates,
+        including CNOT with the control above and below the target.
+        """
+        def dense(gate, qubit, n):
+            # Qiskit order: qubit 0 is the rightmost Kronecker factor
+            ops = [np.eye(2)] * n
+            ops[n - 1 - qubit] = gate
+            out = ops[0]
+            for op in ops[1:]:
+                out = np.kron(out, op)
+            return out
+
+        n = 4
+        rng = np.random.default_rng(3)
+        psi = rng.normal(size=2 ** n) + 1j * rng.normal(size=2 ** n)
+        psi /= np.linalg.norm(psi)
+
+        register = StateVector(n)
+        register.BLOCK = 2
+        register.state[:] = psi
+        register.ry(0.7, 2).cx(3, 1).cx(0, 2)
+
+        p0, p1 = np.diag([1, 0]), np.diag([0, 1])
+        x = np.array([[0, 1], [1, 0]])
+        ry = np.array([[np.cos(0.35), -np.sin(0.35)], [np.sin(0.35), np.cos(0.35)]])
+        expected = dense(ry, 2, n) @ psi
+        expected = (dense(p0, 3, n) + dense(p1, 3, n) @ dense(x, 1, n)) @ expected
+        expected = (dense(p0, 0, n) + dense(p1, 0, n) @ dense(x, 2, n)) @ expected
+        np.testing.assert_allclose(register.state, expected, atol=1e-12)
+
     def test_bell_correlation_logic(self):
         """
         Tests the math of the correlation function (The Mirror Link).
@@ -44,6 +92,46 @@ class TestQuantumCore(unittest.TestCase):
         self.assertEqual(corr, 0.0)
         print(f"✅ Noise Rejection Verified: {corr}")
 
+    def test_sharded_bell_test(self):
+        """
+        Sharded runs are reproducible: the same seed gives the same merged counts
+        whatever the worker count, and shards merge exactly.
+        """
+        serial = run_bell_test(10_000, backend="statevector", seed=7, shard_size=3000)
+        pooled = run_bell_test(10_000, backend="statevector", seed=7, shard_size=3000, workers=2)
+        self.assertEqual(serial, pooled)
+        self.assertEqual(sum(serial.values()), 10_000)
+
+        shards = run_bell_test(10_000, backend="statevector", seed=7, shard_size=3000, merge=False)
+        self.assertEqual([sum(c.values()) for c in shards], [3000, 3000, 3000, 1000])
+        self.assertEqual(calculate_correlation(shards, standard_error=True), (1.0, 0.0))
+
+        aer = run_bell_test(2000, seed=11, shard_size=500)
+        self.assertEqual(aer, run_bell_test(2000, seed=11, shard_size=500))
+        self.assertEqual(set(aer) - {'00', '11'}, set())
+
+    def test_correlation_standard_error(self):
+        """sqrt((1 - E^2) / N) for a pure-noise link."""
+        corr, error = calculate_correlation([{'00': 250, '01': 250}, {'10': 250, '11': 250}],
+                                            standard_error=True)
+        self.assertEqual(corr, 0.0)
+        self.assertAlmostEqual(error, np.sqrt(1 / 1000))
+
+    def test_chsh_sweep(self):
+        """
+        Sweeps the CHSH settings in one batched job.
+        The 'Sweet Spot' must break the classical bound (S > 2);
+        aligned bases collapse back to S = 2.
+        """
+        sweet_spot = [[0, np.pi / 2], [np.pi / 4, 3 * np.pi / 4]]
+        aligned = [[0, 0], [0, 0]]
+        sweep = run_chsh_sweep([sweet_spot, aligned], num_shots=4096)
+
+        self.assertEqual(sweep["correlators"].shape, (2, 4))
+        self.assertGreater(sweep["S"][0], 2.0)
+        self.assertAlmostEqual(sweep["S"][1], 2.0)
+        print(f"✅ CHSH Violation Verified: S = {sweep['S'][0]:.3f}")
+
     def test_operator_integrity(self):
         """
         Ensures the 'Receiver' only accepts Hermitian matrices (Valid Observables).
@@ -61,5 +149,52 @@ class TestQuantumCore(unittest.TestCase):
             QuantumOperator(invalid_matrix, "BadOp")
         print("✅ Operator Integrity Guardrail Active.")
 
+    def test_batched_observables(self):
+        """
+        observe_many and observe_table agree with one-at-a-time readings.
+        """
+        sigma_x = QuantumOperator([[0, 1], [1, 0]], "X-Observable")
+        thetas = np.linspace(0, np.pi, 7)
+        states = np.stack([np.cos(thetas / 2), np.sin(thetas / 2)], axis=1)
+
+        np.testing.assert_allclose(sigma_z.observe_many(states), np.cos(thetas), atol=1e-12)
+        self.assertAlmostEqual(sigma_z.observe_many(states)[2], sigma_z.observe(QuantumState(*states[2])))
+
+        table = observe_table([sigma_z, sigma_x], states)
+        self.assertEqual(table.shape, (7, 2))
+        np.testing.assert_allclose(table[:, 1], np.sin(thetas), atol=1e-12)
+
+        # Banded Fock-space operators plug into the same table
+        fock = np.eye(4)[[0, 3]]
+        np.testing.assert_allclose(observe_table([number_operator(4)], fock)[:, 0], [0, 3])
+        print("✅ Batched Observables Verified.")
+
+    def test_trusted_operator_skips_check(self):
+        """Trusted presets bypass the Hermitian gate; everyone else is still checked."""
+        QuantumOperator([[1, 5], [0, 1]], "Preset", trusted=True)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                QuantumOperator([[1, 5], [0, 1]], "BadOp")
+
+    def test_frozen_matrix_checked_once(self):
+        """A read-only matrix keeps its verdict by identity; writable input is re-checked."""
+        from core_physics import operators
+        hermitian = np.array([[1, 2j], [-2j, 1]])
+        hermitian.setflags(write=False)
+        first = QuantumOperator(hermitian, "Frozen")
+        self.assertIs(first.matrix, hermitian)
+        self.assertIn(id(hermitian), operators._HERMITIAN_VERDICTS)
+        QuantumOperator(hermitian, "Frozen again")
+
+        mutable = np.array([[1, 0], [0, 1]])
+        QuantumOperator(mutable, "Mutable")
+        mutable[0, 1] = 5
+        with self.assertRaises(ValueError):
+            QuantumOperator(mutable, "Mutated")
+
+        key = id(hermitian)
+        del first, hermitian
+        self.assertNotIn(key, operators._HERMITIAN_VERDICTS)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
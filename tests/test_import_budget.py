@@ -0,0 +1,33 @@
+import unittest
+import sys
+import os
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Seconds a cold `import core_physics.bell_test` may take in a fresh interpreter
+IMPORT_BUDGET_SEC = 1.0
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import core_physics.bell_test, core_physics.reality_render
+print(time.perf_counter() - start)
+print(sorted(m for m in sys.modules if m.split('.')[0] in ('qiskit', 'qiskit_aer')))
+"""
+
+class TestImportBudget(unittest.TestCase):
+    def test_bell_test_import_is_lazy(self):
+        """
+        Short-lived workers must not pay for Qiskit until they actually simulate.
+        """
+        output = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.splitlines()
+        elapsed, qiskit_modules = float(output[0]), output[1]
+
+        self.assertEqual(qiskit_modules, "[]")
+        self.assertLess(elapsed, IMPORT_BUDGET_SEC)
+        print(f"✅ Import Budget Verified: {elapsed * 1000:.1f} ms, no Qiskit loaded.")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+
+# Root anchor for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core_physics import instrumentation
+from core_physics.auditor_logic import AuditorLogic
+from core_physics.universal_clock import UniversalClock
+from core_physics.neuro_state import NeuroSubsystem
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled_leaves_methods_untouched(self):
+        original = UniversalClock.__dict__["tick"]
+        instrumentation.enable()
+        self.assertIsNot(UniversalClock.__dict__["tick"], original)
+        instrumentation.disable()
+        self.assertIs(UniversalClock.__dict__["tick"], original)
+
+        UniversalClock().tick()
+        self.assertEqual(instrumentation.snapshot()["calls"], {})
+
+    def test_records_calls_outcomes_and_pulses(self):
+        instrumentation.enable()
+        auditor = AuditorLogic(observer_mass=80, vacuum_index=-1)
+        results = [auditor.process_intent_state("Coherent Signal Alignment") for _ in range(5)]
+        results += auditor.process_intents(["Coherent Signal Alignment"] * 3)
+        metrics = instrumentation.snapshot()
+
+        self.assertEqual(metrics["calls"]["AuditorLogic.process_intent_state"], 5)
+        self.assertEqual(metrics["calls"]["UniversalClock.tick"], 5)
+        self.assertEqual(metrics["calls"]["UniversalClock.tick_many"], 1)
+        self.assertEqual(sum(metrics["causal_status"].values()), 8)
+        self.assertEqual(metrics["causal_status"]["SYNCHRONIZED"],
+                         sum(r["causal_status"] == "SYNCHRONIZED" for r in results))
+        # The quietest environment still adds 0.05 + 0.02 noise: every pulse crosses the 0.10 threshold.
+        tilt = AuditorLogic.entropy_tilt(*AuditorLogic.intent_features(["Coherent Signal Alignment"]))[0]
+        self.assertGreater(0.07 + tilt, 0.10)
+        self.assertEqual(metrics["error_correction_pulses"], 5 + 3)
+
+        histogram = metrics["latency"]["AuditorLogic.process_intent_state"]
+        self.assertEqual(histogram["buckets"][-1], (float("inf"), 5))
+        counts = [count for _, count in histogram["buckets"]]
+        self.assertEqual(counts, sorted(counts))
+
+    def test_batched_recurrence_reports_pulses(self):
+        """process_intents inlines the correction pulses; the hook still counts every one."""
+        instrumentation.enable()
+        AuditorLogic(observer_mass=80, vacuum_index=-1, seed=3).process_intents(["Background Noise"] * 100)
+        self.assertEqual(instrumentation.snapshot()["error_correction_pulses"], 100)
+
+        instrumentation.disable()
+        instrumentation.reset()
+        AuditorLogic(observer_mass=80, vacuum_index=-1).process_intents(["Background Noise"] * 10)
+        self.assertEqual(instrumentation.snapshot()["error_correction_pulses"], 0)
+
+    def test_windowed_audits_are_recorded(self):
+        """Generator audits count as one call each; every window's outcome is tallied."""
+        instrumentation.enable()
+        auditor = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=4)
+        windows = list(auditor.audit_windows(b"Synchronizing Universe... " * 40, window=10, chunk_size=64))
+        metrics = instrumentation.snapshot()
+
+        self.assertEqual(len(windows), 104)
+        self.assertEqual(metrics["calls"]["AuditorLogic.audit_windows"], 1)
+        self.assertEqual(sum(metrics["causal_status"].values()), 104)
+        self.assertEqual(metrics["causal_status"]["DECOHERED"],
+                         sum(w["causal_status"] == "DECOHERED" for w in windows))
+
+    def test_flares_and_return_values_pass_through(self):
+        instrumentation.enable()
+        clock = UniversalClock()
+        report = clock.tick_many(2000)
+        self.assertEqual(instrumentation.snapshot()["solar_flares"], int(report["Solar_Flares"].sum()))
+
+        pfc = NeuroSubsystem([1, 0])
+        pfc.depolarize(0.4)
+        self.assertAlmostEqual(pfc.apply_error_correction(np.diag([1.0, 0.0])), pfc.get_purity())
+
+    def test_export_prometheus_file_and_callback(self):
+        instrumentation.enable()
+        UniversalClock().tick()
+        received = []
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "metrics.prom")
+            instrumentation.export(path=path, callback=received.append)
+            with open(path) as handle:
+                text = handle.read()
+
+        self.assertEqual(received[0]["calls"]["UniversalClock.tick"], 1)
+        self.assertIn('core_physics_calls_total{method="UniversalClock.tick"} 1', text)
+        self.assertIn('core_physics_latency_seconds_bucket{method="UniversalClock.tick",le="+Inf"} 1', text)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+
+# Root anchor for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core_physics.intent_ingest import document_features, iter_window_features
+from core_physics.auditor_logic import AuditorLogic
+
+TEXT = "Synchronizing Universe... Ωmega ψ field ∞ 🌌 aaaa Background Noise\n" * 37
+
+def python_features(text):
+    return len(set(text)), len(text), sum(ord(c) for c in text)
+
+def python_windows(text, window, step):
+    starts = list(range(0, len(text) - window + 1, step))
+    covered = starts[-1] + window if starts else 0
+    next_start = starts[-1] + step if starts else 0
+    if next_start < len(text) and covered < len(text):
+        starts.append(next_start)
+    return [text[start:start + window] for start in starts]
+
+class TestIntentIngest(unittest.TestCase):
+    def test_document_features_across_sources(self):
+        """Paths, buffers and chunk iterators all give the str-based features, whatever the chunking."""
+        expected = python_features(TEXT)
+        encoded = TEXT.encode("utf-8")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "transcript.txt")
+            with open(path, "wb") as handle:
+                handle.write(encoded)
+            for chunk_size in (1, 3, 7, 4096):
+                self.assertEqual(document_features(path, chunk_size=chunk_size), expected)
+                self.assertEqual(document_features(memoryview(encoded), chunk_size=chunk_size), expected)
+        self.assertEqual(document_features(iter([TEXT[:100], TEXT[100:].encode()])), expected)
+        self.assertEqual(document_features(b""), (0, 0, 0))
+
+    def test_window_features_match_slices(self):
+        """Sliding windows straddling chunk boundaries match features of the sliced text."""
+        encoded = TEXT.encode("utf-8")
+        for window, step, chunk_size in [(50, 50, 64), (50, 7, 13), (9, 20, 5), (5000, 1, 256)]:
+            batches = list(iter_window_features(encoded, window, step, chunk_size=chunk_size))
+            unique, total, ordinal = (np.concatenate(column) for column in zip(*batches))
+            expected = [python_features(piece) for piece in python_windows(TEXT, window, step)]
+            self.assertEqual(list(zip(unique.tolist(), total.tolist(), ordinal.tolist())), expected)
+
+    def test_auditor_document_and_windows(self):
+        """Streamed audits pulse exactly like the in-memory string APIs."""
+        encoded = TEXT.encode("utf-8")
+        streamed = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=8)
+        direct = AuditorLogic(observer_mass=80, vacuum_index=-1, seed=8)
+
+        self.assertEqual(streamed.audit_document(encoded, chunk_size=10),
+                         direct.process_intent_state(TEXT))
+
+        windows = list(streamed.audit_windows(encoded, window=40, step=25, chunk_size=100))
+        self.assertEqual(windows, direct.process_intents(python_windows(TEXT, 40, 25)))
+
+if __name__ == '__main__':
+    unittest.main()
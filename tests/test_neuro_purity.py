@@ -6,7 +6,7 @@ import os
 # Root anchor for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from core_physics.neuro_state import NeuroSubsystem
+from core_physics.neuro_state import NeuroSubsystem, BlochNeuroSubsystem, NeuroEnsemble
 
 class TestNeuroPurity(unittest.TestCase):
     def test_purity_baseline(self):
@@ -41,5 +41,54 @@ class TestNeuroPurity(unittest.TestCase):
         self.assertGreater(new_purity, initial_purity)
         print(f"✅ Error Correction Verified: {initial_purity:.4f} -> {new_purity:.4f}")
 
+    def test_bloch_matches_density_matrix(self):
+        """
+        The compact Bloch observer tracks the full density matrix pulse for pulse.
+        """
+        state = np.array([np.cos(0.3), np.exp(0.7j) * np.sin(0.3)])
+        full = NeuroSubsystem(state)
+        compact = BlochNeuroSubsystem(state)
+        reference = np.outer([1, 0], [1, 0])
+
+        self.assertAlmostEqual(compact.get_purity(), 1.0)
+        for noise in (0.1, 0.4, 0.05, 0.7):
+            full.depolarize(noise)
+            compact.depolarize(noise)
+            self.assertAlmostEqual(compact.get_purity(), full.get_purity())
+            self.assertAlmostEqual(compact.apply_error_correction(reference), full.apply_error_correction(reference))
+
+        np.testing.assert_allclose(compact.rho, full.rho, atol=1e-12)
+        round_trip = BlochNeuroSubsystem.from_rho(full.rho)
+        self.assertAlmostEqual(round_trip.get_purity(), full.get_purity())
+        print(f"✅ Bloch Compression Verified: Purity {compact.get_purity():.4f}")
+
+    def test_ensemble_matches_members(self):
+        """
+        Every member of the ensemble follows the single-subsystem laws,
+        including the adaptive 0.5 / 0.2 correction gain.
+        """
+        states = np.array([[1, 0], [1, 1], [1, 1j], [0.6, 0.8]]) / np.array([[1], [np.sqrt(2)], [np.sqrt(2)], [1]])
+        noise = np.array([0.05, 0.3, 0.6, 0.9])
+        reference = np.outer([1, 0], [1, 0])
+
+        ensemble = NeuroEnsemble(states)
+        np.testing.assert_allclose(ensemble.get_purity(), 1.0)
+        ensemble.depolarize(noise)
+        corrected = ensemble.apply_error_correction(reference)
+
+        for k, (state, level) in enumerate(zip(states, noise)):
+            pfc = NeuroSubsystem(state)
+            pfc.depolarize(level)
+            self.assertAlmostEqual(corrected[k], pfc.apply_error_correction(reference))
+            np.testing.assert_allclose(ensemble.rho[k], pfc.rho, atol=1e-12)
+        print(f"✅ Ensemble Purity Verified: {np.round(corrected, 4)}")
+
+    def test_ensemble_depolarizes_non_contiguous_rho(self):
+        """Full depolarization reaches I/2 even when rho is a transposed view."""
+        ensemble = NeuroEnsemble([[1, 0], [0.6, 0.8j]])
+        ensemble.rho = ensemble.rho.transpose(0, 2, 1)
+        ensemble.depolarize(1.0)
+        np.testing.assert_allclose(ensemble.get_purity(), 0.5)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
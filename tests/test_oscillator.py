@@ -1,11 +1,12 @@
 import unittest
 import sys
 import os
+import numpy as np
 
 # Ensure the root directory is in the path so it can find 'core_physics'
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from core_physics.harmonic_oscillator import HarmonicOscillator
+from core_physics.harmonic_oscillator import HarmonicOscillator, LadderOperator, number_operator, eigen_cache_info
 
 class TestOscillator(unittest.TestCase):
     def test_mass_energy_increase(self):
@@ -18,5 +19,76 @@ class TestOscillator(unittest.TestCase):
         self.assertTrue(mass_excited > mass_ground)
         print(f"✅ Mass Increase Verified: {mass_ground} -> {mass_excited}")
 
+    def test_energy_levels_vectorized(self):
+        """The whole ladder of energies in one call."""
+        box = HarmonicOscillator(omega=2.0, mass_zero=1.0)
+        np.testing.assert_allclose(box.calculate_system_energy(np.arange(4)), [1.0, 3.0, 5.0, 7.0])
+        np.testing.assert_allclose(box.get_invariant_mass([0, 5]), [1.0, 11.0])
+
+    def test_time_evolution(self):
+        """
+        Free evolution is a pure phase per rung: after one period 2*pi/omega
+        every state returns to itself (up to the zero-point phase -1).
+        A perturbed Hamiltonian matches the matrix exponential.
+        """
+        from scipy.linalg import expm
+
+        dimension = 8
+        box = HarmonicOscillator(omega=2.0, mass_zero=1.0)
+        rng = np.random.default_rng(1)
+        states = rng.normal(size=(3, dimension)) + 1j * rng.normal(size=(3, dimension))
+        states /= np.linalg.norm(states, axis=1, keepdims=True)
+
+        period = 2 * np.pi / box.omega
+        evolved = box.evolve(states, [0.0, period])
+        self.assertEqual(evolved.shape, (2, 3, dimension))
+        np.testing.assert_allclose(evolved[1], -states, atol=1e-12)
+
+        a = LadderOperator(dimension)
+        drive = 0.3 * (a @ a + a.dagger() @ a.dagger())
+        hamiltonian = np.diag(box.calculate_system_energy(np.arange(dimension))) + drive.matrix
+        times = np.array([0.5, 1.7])
+        perturbed = box.evolve(states[0], times, perturbation=drive)
+        for k, t in enumerate(times):
+            np.testing.assert_allclose(perturbed[k], expm(-1j * hamiltonian * t) @ states[0], atol=1e-10)
+
+        hits = eigen_cache_info()["hits"]
+        box.evolve(states[0], times, perturbation=drive)
+        self.assertEqual(eigen_cache_info()["hits"], hits + 1)
+        print("✅ Oscillator Evolution Verified.")
+
+    def test_banded_ladder_matches_dense(self):
+        """The banded ladder operators are the textbook dense matrices, applied in O(dimension)."""
+        dimension = 6
+        a = LadderOperator(dimension, kind='annihilation')
+        a_dag = LadderOperator(dimension, kind='creation')
+
+        dense_a = np.diag(np.sqrt(np.arange(1, dimension)), 1)
+        np.testing.assert_allclose(a.matrix, dense_a)
+        np.testing.assert_allclose(a_dag.matrix, dense_a.T)
+        np.testing.assert_allclose(a.dagger().matrix, a_dag.matrix)
+
+        # Products stay banded: a_dagger a is the number operator
+        np.testing.assert_allclose((a_dag @ a).matrix, number_operator(dimension).matrix)
+        np.testing.assert_allclose((a @ a_dag).matrix, dense_a @ dense_a.T)
+        np.testing.assert_allclose((a @ a).matrix, dense_a @ dense_a)
+
+        # Batched step: rows are states
+        states = np.random.default_rng(0).normal(size=(4, dimension))
+        np.testing.assert_allclose(a.step(states), states @ dense_a.T)
+        np.testing.assert_allclose(a_dag.step(states[0]), dense_a.T @ states[0])
+        print("✅ Banded Ladder Verified.")
+
+    def test_large_fock_space(self):
+        """A million-rung ladder: a_dagger |n> = sqrt(n + 1) |n + 1>."""
+        dimension = 10**6
+        a_dag = LadderOperator(dimension, kind='creation')
+        state = np.zeros(dimension)
+        state[41] = 1.0
+
+        raised = a_dag.step(state)
+        self.assertAlmostEqual(raised[42], np.sqrt(42))
+        self.assertAlmostEqual(np.abs(raised).sum(), np.sqrt(42))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
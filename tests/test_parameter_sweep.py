@@ -0,0 +1,46 @@
+import unittest
+import sys
+import os
+import tempfile
+import numpy as np
+
+# Root anchor for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core_physics.parameter_sweep import run_sweep
+from core_physics.universal_clock import ClockEnsemble, UniversalClock
+
+def scalar_dilation(mass, vacuum_index):
+    return UniversalClock(observer_mass_kg=mass, vacuum_index=vacuum_index).calculate_dilation()
+
+def vector_dilation(mass, vacuum_index):
+    return ClockEnsemble(observer_mass_kg=mass, vacuum_index=vacuum_index).calculate_dilation()
+
+class TestParameterSweep(unittest.TestCase):
+    def setUp(self):
+        self.axes = {"mass": np.linspace(1, 1000, 13), "vacuum_index": np.linspace(-1, 1, 7)}
+
+    def test_vectorized_matches_scalar(self):
+        """Chunked vectorized evaluation reproduces the point-by-point grid."""
+        scalar = run_sweep(scalar_dilation, self.axes, workers=1)
+        vector = run_sweep(vector_dilation, self.axes, vectorized=True, chunk_size=10, workers=1)
+
+        self.assertEqual(scalar.shape, (13, 7))
+        np.testing.assert_allclose(vector, scalar)
+        self.assertAlmostEqual(scalar[4, 2], scalar_dilation(self.axes["mass"][4], self.axes["vacuum_index"][2]))
+        print("✅ Sweep Grid Coherent.")
+
+    def test_process_pool_to_memmap(self):
+        """Pool workers fill a memory-mapped result that can be reopened offline."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "dilation.npy")
+            pooled = run_sweep(scalar_dilation, self.axes, chunk_size=8, workers=2, out_path=path)
+            expected = run_sweep(vector_dilation, self.axes, vectorized=True, workers=1)
+
+            np.testing.assert_allclose(np.load(path, mmap_mode='r'), expected)
+            np.testing.assert_allclose(np.load(os.path.join(tmp, "dilation.axes.npz"))["mass"], self.axes["mass"])
+            del pooled
+        print("✅ Pooled Memmap Sweep Verified.")
+
+if __name__ == "__main__":
+    unittest.main()
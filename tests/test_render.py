@@ -0,0 +1,68 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Root anchor for imports
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core_physics.reality_render import RealityRenderer
+
+class TestRealityRender(unittest.TestCase):
+    def test_numpy_backend_matches_born_rule(self):
+        """
+        The analytic sampler must reproduce P(1) = sin^2(theta/2) for every intention.
+        """
+        renderer = RealityRenderer(backend="numpy")
+        strengths = np.linspace(0, 1, 11)
+        shots = 20000
+        counts = renderer.manifest_batch(strengths, shots=shots)
+
+        self.assertEqual(counts.shape, strengths.shape)
+        expected = renderer.manifestation_probability(strengths)
+        np.testing.assert_allclose(counts / shots, expected, atol=0.02)
+        print(f"✅ Analytic Render Verified: {counts / shots}")
+
+    def test_backends_agree(self):
+        """
+        Aer and NumPy renders are two views of the same collapse statistics.
+        """
+        strengths = [0.2, 0.5, 0.8]
+        shots = 4000
+        aer = RealityRenderer(backend="aer").manifest_batch(strengths, shots=shots)
+        fast = RealityRenderer(backend="numpy").manifest_batch(strengths, shots=shots)
+
+        np.testing.assert_allclose(aer / shots, fast / shots, atol=0.05)
+        print(f"✅ Backend Agreement Verified: Aer {aer} | NumPy {fast}")
+
+    def test_statevector_backend(self):
+        """The in-process StateVector render follows the same Born rule."""
+        renderer = RealityRenderer(backend="statevector")
+        counts = renderer.manifest_batch([0.0, 0.5, 1.0], shots=4000)
+        np.testing.assert_allclose(counts / 4000, [0.0, 0.5, 1.0], atol=0.05)
+
+    def test_single_render_outcome(self):
+        """Full intention always manifests; zero intention never does."""
+        renderer = RealityRenderer(backend="numpy")
+        self.assertEqual(renderer.manifest_object(1.0), "Object Manifested")
+        self.assertEqual(renderer.manifest_object(0.0), "Stayed in Potential")
+
+        with self.assertRaises(ValueError):
+            RealityRenderer(backend="quantum_foam")
+
+    def test_seeded_renders_reproduce(self):
+        """Seeded renderers replay the same outcomes on every backend, Aer included."""
+        for backend in ("aer", "numpy", "statevector"):
+            first = RealityRenderer(backend=backend, seed=99).manifest_batch([0.3, 0.6], shots=500)
+            second = RealityRenderer(backend=backend, seed=99).manifest_batch([0.3, 0.6], shots=500)
+            np.testing.assert_array_equal(first, second)
+
+    def test_empty_batch(self):
+        """No intentions, no job: every backend returns an empty count array."""
+        for backend in ("aer", "numpy", "statevector"):
+            counts = RealityRenderer(backend=backend).manifest_batch(np.zeros((0, 3)), shots=10)
+            self.assertEqual(counts.shape, (0, 3))
+            self.assertEqual(counts.dtype, np.int64)
+
+if __name__ == "__main__":
+    unittest.main()